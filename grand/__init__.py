@@ -5,11 +5,20 @@ Grand graphs package.
 
 from typing import Optional
 from .backends import Backend, NetworkXBackend
+from .backends._networkx import _DirectedNetworkXBackend, _UndirectedNetworkXBackend
 from .dialects import NetworkXDialect, IGraphDialect, NetworkitDialect
 
 
 _DEFAULT_BACKEND = NetworkXBackend
 
+# Backends whose networkx graph can be handed out as Graph.nx. Subclasses are
+# left out, since writes to the bare graph would skip their overrides:
+_BARE_NX_BACKENDS = (
+    NetworkXBackend,
+    _DirectedNetworkXBackend,
+    _UndirectedNetworkXBackend,
+)
+
 __version__ = "0.6.0"
 
 
@@ -19,6 +28,8 @@ class Graph:
 
     """
 
+    __slots__ = ("backend", "nx", "igraph", "networkit", "_dialects")
+
     nx: NetworkXDialect
     networkit: NetworkitDialect
     igraph: IGraphDialect
@@ -43,10 +54,36 @@ class Graph:
         if isinstance(self.backend, type):
             self.backend = self.backend(**backend_kwargs)
 
-        # Attach dialects:
-        self.attach_dialect("nx", NetworkXDialect)
-        self.attach_dialect("igraph", IGraphDialect)
-        self.attach_dialect("networkit", NetworkitDialect)
+        # Dialects attached under names that are not one of the slots above:
+        self._dialects = {}
+
+    # The dialect slots are filled on first access, so that constructing a
+    # Graph does not pay for dialects that are never used.
+
+    def __getattr__(self, name: str):
+        # This is only called when regular lookup fails: for dialect slots that
+        # have not been filled yet, and for dialects in self._dialects.
+        if name == "nx":
+            # The NetworkX backend already stores a networkx graph, so we hand
+            # that out directly rather than routing every call through a
+            # NetworkXDialect and back into the backend. (Unless the backend
+            # keeps attribute indexes, which writes to the bare graph would skip.)
+            if type(self.backend) in _BARE_NX_BACKENDS and not self.backend._attr_index:
+                dialect = self.backend._nx_graph
+            else:
+                dialect = NetworkXDialect(self)
+        elif name == "igraph":
+            dialect = IGraphDialect(self)
+        elif name == "networkit":
+            dialect = NetworkitDialect(self)
+        elif not name.startswith("_") and name in self._dialects:
+            return self._dialects[name]
+        else:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        setattr(self, name, dialect)
+        return dialect
 
     def attach_dialect(self, name: str, dialect: type):
         """
@@ -57,7 +94,11 @@ class Graph:
             dialect (type): The dialect class to attach.
 
         """
-        setattr(self, name, dialect(self))
+        instance = dialect(self)
+        try:
+            setattr(self, name, instance)
+        except AttributeError:
+            self._dialects[name] = instance
 
 
 class DiGraph(Graph):
@@ -67,6 +108,8 @@ class DiGraph(Graph):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, backend: Optional[Backend] = None, **backend_kwargs: dict):
         """
         Create a new grand.DiGraph.
@@ -0,0 +1,7 @@
+"""
+Accelerated graph kernels.
+
+See `grand.accel.csr` for kernels that run over the CSR arrays of a frozen
+backend (see `Backend.freeze()`).
+
+"""
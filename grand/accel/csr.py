@@ -0,0 +1,122 @@
+"""
+Kernels over compressed sparse row (CSR) adjacency arrays.
+
+These functions take the `indptr` / `indices` arrays of a FrozenBackend (see
+`Backend.freeze()`) and work on integer node positions, not node IDs. They
+only touch NumPy arrays and integers, so numba can compile them. Numba is
+optional: when it is not installed, they run as plain Python.
+
+    >>> frozen = G.backend.freeze()
+    >>> start = frozen.node_index["A"]
+    >>> positions = csr.two_hop_neighbors(frozen.indptr, frozen.indices, start)
+    >>> [frozen.nodes[i] for i in positions]
+
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        A stand-in for numba.njit that leaves functions uncompiled.
+
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+
+@njit(cache=True, parallel=True)
+def degrees(indptr: np.ndarray) -> np.ndarray:
+    """
+    Get the (out-)degree of every node.
+
+    Arguments:
+        indptr (np.ndarray): CSR row pointers
+
+    Returns:
+        np.ndarray: The degree of each node, by position
+
+    """
+    n = len(indptr) - 1
+    out = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        out[i] = indptr[i + 1] - indptr[i]
+    return out
+
+
+@njit(cache=True)
+def bfs_from(
+    indptr: np.ndarray, indices: np.ndarray, source: int, distances: np.ndarray
+) -> int:
+    """
+    Run a breadth-first search, writing hop counts into `distances`.
+
+    Arguments:
+        indptr (np.ndarray): CSR row pointers
+        indices (np.ndarray): CSR column indices
+        source (int): The position of the node to start from
+        distances (np.ndarray): An int64 array with one entry per node. It is
+            overwritten with the number of hops from `source` to each node,
+            or -1 for nodes that cannot be reached.
+
+    Returns:
+        int: The number of nodes reached, including `source`
+
+    """
+    distances[:] = -1
+    queue = np.empty(len(distances), dtype=np.int64)
+    queue[0] = source
+    distances[source] = 0
+    head = 0
+    tail = 1
+    while head < tail:
+        u = queue[head]
+        head += 1
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if distances[v] < 0:
+                distances[v] = distances[u] + 1
+                queue[tail] = v
+                tail += 1
+    return tail
+
+
+@njit(cache=True)
+def two_hop_neighbors(indptr: np.ndarray, indices: np.ndarray, source: int):
+    """
+    Get every node within two hops of a node, not including the node itself.
+
+    Arguments:
+        indptr (np.ndarray): CSR row pointers
+        indices (np.ndarray): CSR column indices
+        source (int): The position of the node to start from
+
+    Returns:
+        np.ndarray: The sorted positions of the nodes within two hops
+
+    """
+    seen = np.zeros(len(indptr) - 1, dtype=np.bool_)
+    seen[source] = True
+    out = np.empty(len(indptr) - 1, dtype=np.int64)
+    count = 0
+    for k in range(indptr[source], indptr[source + 1]):
+        u = indices[k]
+        if not seen[u]:
+            seen[u] = True
+            out[count] = u
+            count += 1
+        for kk in range(indptr[u], indptr[u + 1]):
+            v = indices[kk]
+            if not seen[v]:
+                seen[v] = True
+                out[count] = v
+                count += 1
+    return np.sort(out[:count])
@@ -0,0 +1,46 @@
+import numpy as np
+
+from . import csr
+from ..backends import NetworkXBackend
+
+
+def _frozen():
+    backend = NetworkXBackend(directed=True)
+    for u, v in [("a", "b"), ("b", "c"), ("c", "d"), ("a", "e"), ("f", "a")]:
+        backend.add_edge(u, v, {})
+    return backend.freeze()
+
+
+def test_degrees():
+    frozen = _frozen()
+    degrees = csr.degrees(frozen.indptr)
+    assert dict(zip(frozen.nodes, degrees.tolist())) == frozen.degrees()
+
+
+def test_bfs_from():
+    frozen = _frozen()
+    distances = np.empty(frozen.get_node_count(), dtype=np.int64)
+    reached = csr.bfs_from(
+        frozen.indptr, frozen.indices, frozen.node_index["a"], distances
+    )
+    assert reached == 5
+    assert dict(zip(frozen.nodes, distances.tolist())) == {
+        "a": 0,
+        "b": 1,
+        "c": 2,
+        "d": 3,
+        "e": 1,
+        "f": -1,
+    }
+
+
+def test_two_hop_neighbors():
+    frozen = _frozen()
+    positions = csr.two_hop_neighbors(
+        frozen.indptr, frozen.indices, frozen.node_index["a"]
+    )
+    assert sorted(frozen.nodes[i] for i in positions) == ["b", "c", "e"]
+    positions = csr.two_hop_neighbors(
+        frozen.indptr, frozen.indices, frozen.node_index["d"]
+    )
+    assert len(positions) == 0
@@ -1,21 +1,47 @@
-from .backend import Backend, CachedBackend, InMemoryCachedBackend
+import importlib
 
-try:
-    from ._dynamodb import DynamoDBBackend
-except ImportError:
-    pass
+from .backend import Backend, CachedBackend, InMemoryCachedBackend
 from ._networkx import NetworkXBackend
-from ._dataframe import DataFrameBackend
 
-try:
-    from ._sqlbackend import SQLBackend
-except ImportError:
-    pass
+# These backends pull in heavy or optional dependencies (pandas, boto3,
+# SQLAlchemy, networkit...), so they are only imported on first access:
+_LAZY_BACKENDS = {
+    "DataFrameBackend": "._dataframe",
+    "DynamoDBBackend": "._dynamodb",
+    "FrozenBackend": "._frozen",
+    "SQLBackend": "._sqlbackend",
+    "NetworkitBackend": "._networkit",
+}
+
+# The pip extra that installs each optional backend's dependencies:
+_BACKEND_EXTRAS = {
+    "DynamoDBBackend": "dynamodb",
+    "SQLBackend": "sql",
+    "NetworkitBackend": "networkit",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_BACKENDS:
+        try:
+            module = importlib.import_module(_LAZY_BACKENDS[name], __name__)
+        except ImportError as exc:
+            # Raise AttributeError, so that hasattr() and getattr() with a
+            # default treat the backend as absent:
+            message = f"{name} is not available because a dependency is missing"
+            if name in _BACKEND_EXTRAS:
+                extra = _BACKEND_EXTRAS[name]
+                message += f"; install it with `pip install grand-graph[{extra}]`"
+            raise AttributeError(f"{message} ({exc})") from exc
+        backend = getattr(module, name)
+        globals()[name] = backend
+        return backend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_BACKENDS))
 
-try:
-    from ._networkit import NetworkitBackend
-except ImportError:
-    pass
 
 __all__ = [
     "Backend",
@@ -24,6 +50,7 @@ __all__ = [
     "NetworkXBackend",
     "DataFrameBackend",
     "DynamoDBBackend",
+    "FrozenBackend",
     "SQLBackend",
     "NetworkitBackend",
 ]
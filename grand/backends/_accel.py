@@ -0,0 +1,173 @@
+"""
+Hot loops for NetworkXBackend, written in Cython's pure-python mode.
+
+This module is plain Python and works without a compiler. If the package is
+installed with GRAND_ENABLE_SPEEDUPS=1 (and Cython is available), setup.py
+compiles it to an extension module instead, with the annotated locals typed
+as C-level dicts. The functions take the backend as their first argument and
+are bound as methods by the classes in _networkx.py. They find the networkx
+graph at `self._nx_graph`, so they can also be bound to the graph itself.
+
+"""
+
+try:
+    import cython
+except ImportError:  # pragma: no cover
+
+    class cython:
+        """
+        A stand-in for the parts of the cython module used here.
+
+        """
+
+        compiled = False
+
+        @staticmethod
+        def locals(**_):
+            return lambda function: function
+
+
+def _clear_cache(graph):
+    """
+    Clear the cache that newer versions of networkx keep on each graph.
+
+    This mirrors what networkx does itself after every mutation.
+
+    """
+    cache = getattr(graph, "__networkx_cache__", None)
+    if cache:
+        cache.clear()
+
+
+@cython.locals(nodes=dict, adj=dict)
+def undirected_add_node(self, node_name, metadata=None):
+    g = self._nx_graph
+    nodes = g._node
+    if node_name in nodes:
+        if metadata:
+            nodes[node_name].update(metadata)
+    else:
+        if node_name is None:
+            raise ValueError("None cannot be a node")
+        adj = g._adj
+        adj[node_name] = g.adjlist_inner_dict_factory()
+        attrs = nodes[node_name] = g.node_attr_dict_factory()
+        if metadata:
+            attrs.update(metadata)
+    _clear_cache(g)
+
+
+@cython.locals(nodes=dict, adj=dict)
+def undirected_add_edge(self, u, v, metadata=None):
+    g = self._nx_graph
+    nodes = g._node
+    adj = g._adj
+    for node in (u, v):
+        if node not in adj:
+            if node is None:
+                raise ValueError("None cannot be a node")
+            adj[node] = g.adjlist_inner_dict_factory()
+            nodes[node] = g.node_attr_dict_factory()
+
+    data = adj[u].get(v)
+    if data is None:
+        data = adj[u][v] = adj[v][u] = g.edge_attr_dict_factory()
+    if metadata:
+        data.update(metadata)
+    _clear_cache(g)
+
+
+@cython.locals(nodes=dict, succ=dict, pred=dict)
+def directed_add_node(self, node_name, metadata=None):
+    g = self._nx_graph
+    nodes = g._node
+    if node_name in nodes:
+        if metadata:
+            nodes[node_name].update(metadata)
+    else:
+        if node_name is None:
+            raise ValueError("None cannot be a node")
+        succ = g._succ
+        pred = g._pred
+        succ[node_name] = g.adjlist_inner_dict_factory()
+        pred[node_name] = g.adjlist_inner_dict_factory()
+        attrs = nodes[node_name] = g.node_attr_dict_factory()
+        if metadata:
+            attrs.update(metadata)
+    _clear_cache(g)
+
+
+@cython.locals(nodes=dict, succ=dict, pred=dict)
+def directed_add_edge(self, u, v, metadata=None):
+    g = self._nx_graph
+    nodes = g._node
+    succ = g._succ
+    pred = g._pred
+    for node in (u, v):
+        if node not in succ:
+            if node is None:
+                raise ValueError("None cannot be a node")
+            succ[node] = g.adjlist_inner_dict_factory()
+            pred[node] = g.adjlist_inner_dict_factory()
+            nodes[node] = g.node_attr_dict_factory()
+
+    data = succ[u].get(v)
+    if data is None:
+        data = succ[u][v] = pred[v][u] = g.edge_attr_dict_factory()
+    if metadata:
+        data.update(metadata)
+    _clear_cache(g)
+
+
+@cython.locals(nodes=dict)
+def all_nodes_as_iterable(self, include_metadata=False):
+    """
+    Get a generator of all of the nodes in this graph.
+
+    Arguments:
+        include_metadata (bool: False): Whether to include node metadata in
+            the response
+
+    Returns:
+        Generator: A generator of all nodes (arbitrary sort)
+
+    """
+    nodes = self._nx_graph._node
+    if include_metadata:
+        yield from nodes.items()
+    else:
+        yield from nodes
+
+
+@cython.locals(adj=dict, nbrs=dict, seen=set)
+def all_edges_as_iterable(self, include_metadata=False):
+    """
+    Get a list of all edges in this graph, arbitrary sort.
+
+    Arguments:
+        include_metadata (bool: False): Whether to include edge metadata
+
+    Returns:
+        Generator: A generator of all edges (arbitrary sort)
+
+    """
+    # Walk the adjacency dicts directly rather than building an EdgeView.
+    # (For directed graphs, networkx's _adj is the successor dict.)
+    adj = self._nx_graph._adj
+    if self._directed:
+        for u, nbrs in adj.items():
+            if include_metadata:
+                for v, data in nbrs.items():
+                    yield (u, v, data)
+            else:
+                for v in nbrs:
+                    yield (u, v)
+    else:
+        # Each undirected edge appears in the adjacency of both of its
+        # endpoints, so skip neighbors whose edges were already reported:
+        seen = set()
+        for u, nbrs in adj.items():
+            for v, data in nbrs.items():
+                if v not in seen:
+                    yield (u, v, data) if include_metadata else (u, v)
+            seen.add(u)
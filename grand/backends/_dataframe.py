@@ -1,12 +1,46 @@
-from typing import Hashable, Generator
+from typing import Collection, Hashable, Generator
+from bisect import bisect_left
 import time
 
+import cachetools
+import numpy as np
 import pandas as pd
 
 from .backend import Backend
 
+# Marks node attributes that were never set, in the node attribute columns.
+_MISSING = object()
+
+
+def _common_rows(a: list, b: list) -> list:
+    """
+    Get the row positions that appear in both of two ascending lists.
+
+    Each position in the shorter list is binary-searched in the longer one,
+    so an edge lookup between a hub and a leaf costs about log(hub degree).
+
+    Arguments:
+        a (Sequence): Ascending row positions
+        b (Sequence): Ascending row positions
+
+    Returns:
+        list: The common positions, ascending
+
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    common = []
+    for position in a:
+        i = bisect_left(b, position)
+        if i < len(b) and b[i] == position:
+            common.append(position)
+    return common
+
 
 class DataFrameBackend(Backend):
+    # The number of edge metadata dictionaries to keep; see `get_edge_by_id`.
+    _edge_cache_size = 4096
+
     def __init__(
         self,
         directed: bool = False,
@@ -38,11 +72,255 @@ class DataFrameBackend(Backend):
             if edge_df is not None
             else pd.DataFrame(columns=[edge_df_source_column, edge_df_target_column])
         )
-        self._node_df = node_df if node_df is not None else None
         self._edge_df_source_column = edge_df_source_column
         self._edge_df_target_column = edge_df_target_column
         self._node_df_id_column = node_df_id_column
 
+        # The node table, stored column-wise: the node IDs in insertion order,
+        # each node's position in that list, and one list of values per
+        # attribute. These are None until the graph has a node table.
+        self._node_index = None
+        self._node_pos = None
+        self._node_attrs = None
+        if node_df is not None:
+            self._node_index = node_df.index.tolist()
+            self._node_pos = {node: i for i, node in enumerate(self._node_index)}
+            self._node_attrs = {
+                column: node_df[column].tolist() for column in node_df.columns
+            }
+
+        # Adjacency indexes, mapping each node ID to the row positions in
+        # `_edge_df` (in ascending order, as an array or list) of the edges
+        # that start (out) or end (in) at that node. They are built on first
+        # use; see `_adjacency`.
+        self._out_rows = None
+        self._in_rows = None
+        # The source and target columns as NumPy arrays; see `_endpoints`.
+        self._src = None
+        self._tgt = None
+        # The metadata columns as NumPy arrays; see `_metadata_columns`.
+        self._columns = None
+        # Rows added by `add_edge` that have not been written to `_edge_df`
+        # yet. They occupy the row positions after the end of `_edge_df`, and
+        # are already included in the adjacency indexes. See `_flush`.
+        self._pending_edges = []
+        # The IDs of all nodes in the graph; see `_node_ids`.
+        self._node_set = None
+        # Metadata of recently read edges, keyed by row position.
+        self._edge_cache = cachetools.LRUCache(maxsize=self._edge_cache_size)
+
+    def _node_ids(self) -> set:
+        """
+        Get the set of node IDs in this graph, building it if necessary.
+
+        If there is a node table, its index holds the node IDs. Otherwise the
+        nodes are the endpoints of the edges.
+
+        Arguments:
+            None
+
+        Returns:
+            set: The node IDs. This is not a copy
+
+        """
+        if self._node_set is None:
+            if self._node_pos is not None:
+                self._node_set = set(self._node_pos)
+            else:
+                src, tgt = self._endpoints()
+                self._node_set = set(src.tolist()).union(tgt.tolist())
+        return self._node_set
+
+    def _flush(self):
+        """
+        Write any pending edges to `_edge_df`, in a single concatenation.
+
+        Appending to a DataFrame one row at a time copies the whole table for
+        each row, so `add_edge` buffers new rows instead. Every method that
+        reads `_edge_df` directly must call this first.
+
+        Arguments:
+            None
+
+        Returns:
+            None
+
+        """
+        if not self._pending_edges:
+            return
+        pending = pd.DataFrame.from_records(self._pending_edges)
+        if not pending.columns.isin(self._edge_df.columns).all():
+            # New columns add a (missing) value to every cached edge:
+            self._edge_cache.clear()
+        if len(self._edge_df):
+            self._edge_df = pd.concat([self._edge_df, pending], ignore_index=True)
+        else:
+            self._edge_df = pending.reindex(
+                columns=self._edge_df.columns.union(pending.columns, sort=False)
+            )
+        self._pending_edges = []
+        self._src = self._tgt = None
+        self._columns = None
+
+    def _endpoints(self):
+        """
+        Get the source and target columns of `_edge_df` as NumPy arrays.
+
+        The arrays are cached until the edge table changes shape, so that hot
+        paths can index them directly instead of going through pandas. They
+        are always contiguous: a column of a DataFrame built from a 2-D array
+        is a strided view, which is slower to gather from.
+
+        Arguments:
+            None
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The source and target arrays
+
+        """
+        self._flush()
+        if self._src is None:
+            self._src, self._tgt = (
+                np.ascontiguousarray(self._edge_df[column].to_numpy())
+                for column in (self._edge_df_source_column, self._edge_df_target_column)
+            )
+        return self._src, self._tgt
+
+    def _metadata_columns(self) -> list:
+        """
+        Get the metadata columns of `_edge_df` as NumPy arrays.
+
+        Like `_endpoints`, the arrays are cached until the edge table changes,
+        so that reading a few rows indexes arrays rather than going through
+        pandas row selection.
+
+        Arguments:
+            None
+
+        Returns:
+            List[Tuple[str, np.ndarray]]: (column name, values) pairs
+
+        """
+        self._flush()
+        if self._columns is None:
+            source, target = self._edge_df_source_column, self._edge_df_target_column
+            self._columns = []
+            for column in self._edge_df.columns:
+                if column in (source, target):
+                    continue
+                values = self._edge_df[column]
+                if values.dtype.kind in "mM":
+                    # Keep pandas Timestamps / Timedeltas rather than ints:
+                    values = values.astype(object)
+                self._columns.append((column, np.ascontiguousarray(values.to_numpy())))
+        return self._columns
+
+    def _adjacency(self):
+        """
+        Get the out- and in-adjacency indexes, building them if necessary.
+
+        Both are built with a single groupby each. The row positions of each
+        node stay in the NumPy arrays that groupby returns, until a new edge
+        is appended to them (see `_append_row`).
+
+        Arguments:
+            None
+
+        Returns:
+            Tuple[dict, dict]: The out- and in-adjacency indexes
+
+        """
+        if self._out_rows is None:
+            self._flush()
+            self._out_rows, self._in_rows = (
+                self._edge_df.groupby(column, sort=False, observed=True).indices
+                for column in (
+                    self._edge_df_source_column,
+                    self._edge_df_target_column,
+                )
+            )
+        return self._out_rows, self._in_rows
+
+    @staticmethod
+    def _append_row(index: dict, node: Hashable, position: int):
+        """
+        Append a row position to a node's entry in an adjacency index.
+
+        Arguments:
+            index (dict): The out- or in-adjacency index
+            node (Hashable): The node ID
+            position (int): The row position of the new edge
+
+        Returns:
+            None
+
+        """
+        rows = index.get(node)
+        if rows is None:
+            index[node] = [position]
+        else:
+            if not isinstance(rows, list):
+                rows = index[node] = rows.tolist()
+            rows.append(position)
+
+    def _edge_rows(self, u: Hashable, v: Hashable) -> list:
+        """
+        Get the row positions in `_edge_df` of the edges between u and v.
+
+        For undirected graphs, this includes edges stored as (v, u), after
+        those stored as (u, v).
+
+        Arguments:
+            u (Hashable): The source node ID
+            v (Hashable): The target node ID
+
+        Returns:
+            list: Row positions, in order
+
+        """
+        out_rows, in_rows = self._adjacency()
+        rows = _common_rows(out_rows.get(u, []), in_rows.get(v, []))
+        if not self._directed and u != v:
+            rows += _common_rows(out_rows.get(v, []), in_rows.get(u, []))
+        return rows
+
+    def _incident_rows(self, u: Hashable) -> list:
+        """
+        Get the row positions in `_edge_df` of all edges touching u, in order.
+
+        Arguments:
+            u (Hashable): The node ID
+
+        Returns:
+            list: Row positions
+
+        """
+        out_rows, in_rows = self._adjacency()
+        return sorted(set(out_rows.get(u, ())).union(in_rows.get(u, ())))
+
+    @property
+    def node_df(self) -> pd.DataFrame:
+        """
+        The node table as a DataFrame, indexed by node ID.
+
+        This is built from the node attribute columns on each access, so
+        prefer the backend methods for lookups. Attributes that were never
+        set for a node are NaN.
+
+        Returns:
+            pd.DataFrame: The node table, or None if there is none
+
+        """
+        if self._node_index is None:
+            return None
+        return pd.DataFrame(
+            {
+                column: [np.nan if v is _MISSING else v for v in values]
+                for column, values in self._node_attrs.items()
+            },
+            index=pd.Index(self._node_index, name=self._node_df_id_column),
+        )
+
     def is_directed(self) -> bool:
         """
         Return True if the backend graph is directed.
@@ -77,34 +355,27 @@ class DataFrameBackend(Backend):
             Hashable: The ID of this node, as inserted
 
         """
+        # Make sure edge-only nodes are recorded before the table exists:
+        node_ids = self._node_ids()
 
-        # Add a new row to the nodes table:
-        if self._node_df is None:
-            self._node_df = pd.DataFrame(
-                [
-                    {
-                        self._node_df_id_column: node_name,
-                        **metadata,
-                    }
-                ],
-                columns=[
-                    self._node_df_id_column,
-                    *metadata.keys(),
-                ],
-            )
-            self._node_df.set_index(self._node_df_id_column, inplace=True)
-        else:
-            if self.has_node(node_name):
-                existing_metadata = self.get_node_by_id(node_name)
-                existing_metadata.update(metadata)
-                for k, v in existing_metadata.items():
-                    self._node_df.at[node_name, k] = v
-            else:
-                # Insert a new row:
-                self._node_df = pd.concat(
-                    [self._node_df, pd.DataFrame([{node_name: metadata}]).T]
-                )
+        if self._node_index is None:
+            self._node_index, self._node_pos, self._node_attrs = [], {}, {}
 
+        position = self._node_pos.get(node_name)
+        if position is None:
+            # Append a new row:
+            position = self._node_pos[node_name] = len(self._node_index)
+            self._node_index.append(node_name)
+            for values in self._node_attrs.values():
+                values.append(_MISSING)
+
+        for k, v in metadata.items():
+            values = self._node_attrs.get(k)
+            if values is None:
+                values = self._node_attrs[k] = [_MISSING] * len(self._node_index)
+            values[position] = v
+
+        node_ids.add(node_name)
         return node_name
 
     def all_nodes_as_iterable(self, include_metadata: bool = False):
@@ -119,27 +390,34 @@ class DataFrameBackend(Backend):
             Generator: A generator of all nodes (arbitrary sort)
 
         """
-        if self._node_df is not None:
-            return [
-                (
-                    (
-                        node_id,
-                        row.to_dict(),
-                    )
-                    if include_metadata
-                    else node_id
+        if self._node_index is None:
+            # Each distinct endpoint once, in order of first appearance:
+            nodes = pd.unique(np.concatenate(self._endpoints())).tolist()
+            if include_metadata:
+                yield from ((node_id, {}) for node_id in nodes)
+            else:
+                yield from nodes
+            return
+
+        columns = self._node_attrs.items()
+        for i, node_id in enumerate(self._node_index):
+            if include_metadata:
+                yield (
+                    node_id,
+                    {
+                        k: values[i]
+                        for k, values in columns
+                        if values[i] is not _MISSING
+                    },
                 )
-                for node_id, row in self._node_df.iterrows()
-            ]
+            else:
+                yield node_id
 
-        else:
-            return [
-                (node_id, {}) if include_metadata else node_id
-                for node_id in self._edge_df[self._edge_df_source_column]
-            ] + [
-                (node_id, {}) if include_metadata else node_id
-                for node_id in self._edge_df[self._edge_df_target_column]
-            ]
+        # Nodes that were only seen in the edge table before the node table
+        # was created have no row in it:
+        if self._node_set is not None and len(self._node_set) > len(self._node_pos):
+            for node_id in self._node_set.difference(self._node_pos):
+                yield (node_id, {}) if include_metadata else node_id
 
     def has_node(self, u: Hashable) -> bool:
         """
@@ -151,11 +429,22 @@ class DataFrameBackend(Backend):
         Returns:
             bool: True if the node exists
         """
-        if self._node_df is not None:
-            return u in self._node_df.index
+        return u in self._node_ids()
+
+    def has_nodes(self, node_names: Collection) -> np.ndarray:
+        """
+        Check whether each of many nodes exists in the graph.
+
+        Arguments:
+            node_names (Collection): The IDs of the nodes to check
 
-        return u in (self._edge_df[self._edge_df_source_column]) or u in (
-            self._edge_df[self._edge_df_target_column]
+        Returns:
+            np.ndarray: A boolean array, True where the node exists
+
+        """
+        node_ids = self._node_ids()
+        return np.fromiter(
+            (u in node_ids for u in node_names), dtype=bool, count=len(node_names)
         )
 
     def add_edge(self, u: Hashable, v: Hashable, metadata: dict):
@@ -180,36 +469,44 @@ class DataFrameBackend(Backend):
         if not self.has_node(v):
             self.add_node(v, {})
 
-        if self._has_edge(u, v):
-            # Update the existing edge:
-            for k, m in metadata.items():
-                if self._directed:
-                    self._edge_df.loc[
-                        (self._edge_df[self._edge_df_source_column] == u)
-                        & (self._edge_df[self._edge_df_target_column] == v),
-                        k,
-                    ] = m
+        out_rows, in_rows = self._adjacency()
+        rows = self._edge_rows(u, v)
+        written = len(self._edge_df)
+        if rows:
+            # Update the existing edge, wherever it currently lives:
+            for position in rows[:]:
+                if position >= written:
+                    self._pending_edges[position - written].update(metadata)
+                    rows.remove(position)
+            if rows and metadata:
+                if set(metadata).issubset(self._edge_df.columns):
+                    for position in rows:
+                        self._edge_cache.pop(position, None)
                 else:
-                    # Check for the edge in both directions:
-                    self._edge_df.loc[
-                        (self._edge_df[self._edge_df_source_column] == u)
-                        & (self._edge_df[self._edge_df_target_column] == v),
-                        k,
-                    ] = m
-                    self._edge_df.loc[
-                        (self._edge_df[self._edge_df_source_column] == v)
-                        & (self._edge_df[self._edge_df_target_column] == u),
-                        k,
-                    ] = m
+                    self._edge_cache.clear()
+                    # New keys become new (missing everywhere) columns:
+                    for column in metadata:
+                        if column not in self._edge_df.columns:
+                            self._edge_df[column] = np.full(
+                                len(self._edge_df), np.nan, dtype=object
+                            )
+                self._columns = None
+                # One assignment for all keys, by position, since index labels
+                # may repeat:
+                self._edge_df.iloc[
+                    rows, self._edge_df.columns.get_indexer(list(metadata))
+                ] = list(metadata.values())
         else:
-            row = {
-                self._edge_df_source_column: u,
-                self._edge_df_target_column: v,
-                **metadata,
-            }
-            self._edge_df.loc[len(self._edge_df)] = None
-            for k, m in row.items():
-                self._edge_df.loc[len(self._edge_df) - 1, k] = m
+            position = written + len(self._pending_edges)
+            self._pending_edges.append(
+                {
+                    self._edge_df_source_column: u,
+                    self._edge_df_target_column: v,
+                    **metadata,
+                }
+            )
+            self._append_row(out_rows, u, position)
+            self._append_row(in_rows, v, position)
         return (u, v)
 
     def _has_edge(self, u: Hashable, v: Hashable) -> bool:
@@ -223,19 +520,7 @@ class DataFrameBackend(Backend):
         Returns:
             bool: True if the edge exists
         """
-        if self._directed:
-            return (
-                (self._edge_df[self._edge_df_source_column] == u)
-                & (self._edge_df[self._edge_df_target_column] == v)
-            ).any()
-        else:
-            return (
-                (self._edge_df[self._edge_df_source_column] == u)
-                & (self._edge_df[self._edge_df_target_column] == v)
-            ).any() or (
-                (self._edge_df[self._edge_df_source_column] == v)
-                & (self._edge_df[self._edge_df_target_column] == u)
-            ).any()
+        return bool(self._edge_rows(u, v))
 
     def all_edges_as_iterable(self, include_metadata: bool = False) -> Generator:
         """
@@ -248,18 +533,22 @@ class DataFrameBackend(Backend):
             Generator: A generator of all edges (arbitrary sort)
 
         """
-        for _, row in self._edge_df.iterrows():
-            if include_metadata:
-                yield (
-                    row[self._edge_df_source_column],
-                    row[self._edge_df_target_column],
-                    dict(row),
-                )
-            else:
-                yield (
-                    row[self._edge_df_source_column],
-                    row[self._edge_df_target_column],
-                )
+        src, tgt = self._endpoints()
+        if not include_metadata:
+            yield from zip(src.tolist(), tgt.tolist())
+            return
+
+        # The metadata includes the endpoint columns, as it always has:
+        columns = self._metadata_columns()
+        names = (
+            self._edge_df_source_column,
+            self._edge_df_target_column,
+            *(name for name, _ in columns),
+        )
+        for row in zip(
+            src.tolist(), tgt.tolist(), *(values.tolist() for _, values in columns)
+        ):
+            yield (row[0], row[1], dict(zip(names, row)))
 
     def get_node_by_id(self, node_name: Hashable):
         """
@@ -272,9 +561,18 @@ class DataFrameBackend(Backend):
             dict: The metadata associated with this node
 
         """
-        if self._node_df is not None:
-            res = (self._node_df.loc[node_name]).to_dict()
-            return res.get(0, res)
+        if self._node_pos is not None:
+            position = self._node_pos.get(node_name)
+            if position is None:
+                # Nodes known only from the edge table have no metadata:
+                if self.has_node(node_name):
+                    return {}
+                raise KeyError(node_name)
+            return {
+                k: values[position]
+                for k, values in self._node_attrs.items()
+                if values[position] is not _MISSING
+            }
 
         return {}
 
@@ -290,27 +588,70 @@ class DataFrameBackend(Backend):
             dict: Metadata associated with this edge
 
         """
-        if self._directed:
-            result = self._edge_df[
-                (self._edge_df[self._edge_df_source_column] == u)
-                & (self._edge_df[self._edge_df_target_column] == v)
-            ]
-            if len(result):
-                return self._edge_as_dict(result.iloc[0])
+        rows = self._edge_rows(u, v)
+        if rows:
+            metadata = self._edge_cache.get(rows[0])
+            if metadata is None:
+                metadata = self._edge_metadata(rows[:1])[0]
+                self._edge_cache[rows[0]] = metadata
+            return dict(metadata)
 
-        else:
-            left = self._edge_df[
-                (self._edge_df[self._edge_df_source_column] == u)
-                & (self._edge_df[self._edge_df_target_column] == v)
-            ]
-            if len(left):
-                return self._edge_as_dict(left.iloc[0])
-            right = self._edge_df[
-                (self._edge_df[self._edge_df_source_column] == v)
-                & (self._edge_df[self._edge_df_target_column] == u)
-            ]
-            if len(right):
-                return self._edge_as_dict(right.iloc[0])
+    def get_node_columns(self, node_names: Collection) -> dict:
+        """
+        Get the metadata of many nodes at once, as one array per column.
+
+        This reads each attribute column once, rather than building a
+        dictionary per node.
+
+        Arguments:
+            node_names (Collection): The node IDs to look up
+
+        Returns:
+            dict: A mapping from each metadata column to a NumPy array, with
+                one entry per requested node, in order. Nodes without
+                metadata get missing values (NaN).
+
+        """
+        if self._node_pos is None:
+            return {}
+        positions = [self._node_pos.get(node) for node in node_names]
+        return {
+            column: pd.Series(
+                [
+                    np.nan if p is None or values[p] is _MISSING else values[p]
+                    for p in positions
+                ]
+            ).to_numpy()
+            for column, values in self._node_attrs.items()
+        }
+
+    def get_edge_columns(self, edges: Collection) -> dict:
+        """
+        Get the metadata of many edges at once, as one array per column.
+
+        Arguments:
+            edges (Collection): (source, target) pairs to look up
+
+        Returns:
+            dict: A mapping from each metadata column to a NumPy array, with
+                one entry per requested edge, in order. Edges that do not
+                exist get missing values (NaN).
+
+        """
+        edges = list(edges)
+        found, positions = [], []
+        for i, (u, v) in enumerate(edges):
+            rows = self._edge_rows(u, v)
+            if rows:
+                found.append(i)
+                positions.append(rows[0])
+        self._flush()
+        rows = self._edge_df.iloc[positions].drop(
+            columns=[self._edge_df_source_column, self._edge_df_target_column]
+        )
+        rows.index = found
+        rows = rows.reindex(range(len(edges)))
+        return {column: rows[column].to_numpy() for column in rows.columns}
 
     def get_node_neighbors(self, u: Hashable, include_metadata: bool = False):
         """
@@ -323,67 +664,70 @@ class DataFrameBackend(Backend):
             Generator
 
         """
-
+        rows, neighbors = self._neighbor_rows(u)
         if include_metadata:
-            if self._directed:
-                return {
-                    (r[self._edge_df_target_column]): self._edge_as_dict(r)
-                    for _, r in self._edge_df[
-                        (self._edge_df[self._edge_df_source_column] == u)
-                    ].iterrows()
-                }
-            else:
-                return {
-                    (
-                        r[self._edge_df_source_column]
-                        if r[self._edge_df_source_column] != u
-                        else r[self._edge_df_target_column]
-                    ): self._edge_as_dict(r)
-                    for _, r in self._edge_df[
-                        (self._edge_df[self._edge_df_source_column] == u)
-                        | (self._edge_df[self._edge_df_target_column] == u)
-                    ].iterrows()
-                }
+            return dict(zip(neighbors.tolist(), self._edge_metadata(rows)))
+        return iter(neighbors.tolist())
+
+    def get_node_neighbors_array(self, u: Hashable) -> np.ndarray:
+        """
+        Get the downstream neighbors of a node as a NumPy array.
 
+        This skips the conversion to Python objects that the generator from
+        `get_node_neighbors` does, for callers that process neighbors with
+        NumPy. The array has the dtype of the edge table's ID columns.
+
+        Arguments:
+            u (Hashable): The source node ID
+
+        Returns:
+            np.ndarray: The neighbor IDs, one per edge
+
+        """
+        return self._neighbor_rows(u)[1]
+
+    def _neighbor_rows(self, u: Hashable):
+        """
+        Get the rows of the edges leaving u, and the node at their other end.
+
+        Arguments:
+            u (Hashable): The source node ID
+
+        Returns:
+            Tuple[list, np.ndarray]: Row positions, and the neighbor IDs
+
+        """
         if self._directed:
-            return iter(
-                [
-                    row[self._edge_df_target_column]
-                    for _, row in self._edge_df[
-                        (self._edge_df[self._edge_df_source_column] == u)
-                    ].iterrows()
-                ]
-            )
-        else:
-            return iter(
-                [
-                    (
-                        row[self._edge_df_source_column]
-                        if row[self._edge_df_source_column] != u
-                        else row[self._edge_df_target_column]
-                    )
-                    for _, row in self._edge_df[
-                        (self._edge_df[self._edge_df_source_column] == u)
-                        | (self._edge_df[self._edge_df_target_column] == u)
-                    ].iterrows()
-                ]
-            )
+            rows = self._adjacency()[0].get(u, [])
+            return rows, self._endpoints()[1][rows]
+
+        # Take the other endpoint of each incident edge, in one pass:
+        rows = self._incident_rows(u)
+        src, tgt = self._endpoints()
+        src, tgt = src[rows], tgt[rows]
+        return rows, np.where(src != u, src, tgt)
 
-    def _edge_as_dict(self, row):
+    def _edge_metadata(self, rows: list = None) -> list:
         """
-        Convert an edge row to a dictionary.
+        Get the metadata of the edges at some row positions, as dictionaries.
 
         Arguments:
-            row (pandas.Series): The edge row
+            rows (list: None): Row positions in `_edge_df`, or None for all
 
         Returns:
-            dict: The edge metadata
+            List[dict]: The metadata of each edge, in the same order
 
         """
-        r = row.to_dict()
-        r.pop(self._edge_df_source_column)
-        r.pop(self._edge_df_target_column)
-        return r
+        columns = self._metadata_columns()
+        count = len(self._edge_df) if rows is None else len(rows)
+        if not columns:
+            return [{} for _ in range(count)]
+        names = [name for name, _ in columns]
+        if rows is None:
+            values = [array.tolist() for _, array in columns]
+        else:
+            values = [array[rows].tolist() for _, array in columns]
+        return [dict(zip(names, row)) for row in zip(*values)]
 
     def get_node_predecessors(self, u: Hashable, include_metadata: bool = False):
         """
@@ -397,54 +741,15 @@ class DataFrameBackend(Backend):
 
         """
 
-        if include_metadata:
-            if self._directed:
-                return {
-                    (
-                        r[self._edge_df_target_column]
-                        if r[self._edge_df_target_column] != u
-                        else r[self._edge_df_source_column]
-                    ): self._edge_as_dict(r)
-                    for _, r in self._edge_df[
-                        (self._edge_df[self._edge_df_target_column] == u)
-                    ].iterrows()
-                }
-            else:
-                return {
-                    (
-                        r[self._edge_df_target_column]
-                        if r[self._edge_df_target_column] != u
-                        else r[self._edge_df_source_column]
-                    ): self._edge_as_dict(r)
-                    for _, r in self._edge_df[
-                        (self._edge_df[self._edge_df_target_column] == u)
-                        | (self._edge_df[self._edge_df_source_column] == u)
-                    ].iterrows()
-                }
+        if not self._directed:
+            # Every neighbor of an undirected node is also a predecessor:
+            return self.get_node_neighbors(u, include_metadata)
 
-        if self._directed:
-            return iter(
-                [
-                    row[self._edge_df_source_column]
-                    for _, row in self._edge_df[
-                        (self._edge_df[self._edge_df_target_column] == u)
-                    ].iterrows()
-                ]
-            )
-        else:
-            return iter(
-                [
-                    (
-                        row[self._edge_df_source_column]
-                        if row[self._edge_df_target_column] != u
-                        else row[self._edge_df_target_column]
-                    )
-                    for _, row in self._edge_df[
-                        (self._edge_df[self._edge_df_target_column] == u)
-                        | (self._edge_df[self._edge_df_source_column] == u)
-                    ].iterrows()
-                ]
-            )
+        rows = self._adjacency()[1].get(u, [])
+        predecessors = self._endpoints()[0][rows].tolist()
+        if include_metadata:
+            return dict(zip(predecessors, self._edge_metadata(rows)))
+        return iter(predecessors)
 
     def get_node_count(self) -> int:
         """
@@ -457,14 +762,12 @@ class DataFrameBackend(Backend):
             int: The count of nodes
 
         """
-        if self._node_df is not None:
-            return len(self._node_df)
-        # Return number of unique sources intersected with number of unique targets
-        return len(
-            set(self._edge_df[self._edge_df_source_column]).intersection(
-                set(self._edge_df[self._edge_df_target_column])
-            )
-        )
+        if self._node_set is not None:
+            return len(self._node_set)
+        if self._node_index is not None:
+            return len(self._node_index)
+        # Count the distinct endpoints, without building a set of them:
+        return len(pd.unique(np.concatenate(self._endpoints())))
 
     def get_edge_count(self) -> int:
         """
@@ -477,22 +780,119 @@ class DataFrameBackend(Backend):
             int: The count of edges
 
         """
-        return len(self._edge_df)
+        return len(self._edge_df) + len(self._pending_edges)
 
     def ingest_from_edgelist_dataframe(
-        self, edgelist: pd.DataFrame, source_column: str, target_column: str
+        self,
+        edgelist: pd.DataFrame,
+        source_column: str,
+        target_column: str,
+        downcast: bool = True,
     ) -> dict:
         """
         Ingest an edgelist from a Pandas DataFrame.
 
+        Arguments:
+            edgelist (pd.DataFrame): The edgelist, with one edge per row
+            source_column (str): The name of the column of edge sources
+            target_column (str): The name of the column of edge targets
+            downcast (bool: True): Whether to store integer node IDs in the
+                smallest integer type that fits them, and string node IDs
+                as categoricals, to save memory. Metadata columns keep their
+                types, so later updates cannot overflow them.
+
+        The edgelist is copied, so later updates to edges do not write
+        through to the caller's DataFrame.
+
+        Returns:
+            dict: Timing information
+
         """
         # Produce edge list:
 
         edge_tic = time.time()
+        edgelist = edgelist.copy()
+        if downcast:
+            for column in (source_column, target_column):
+                values = edgelist[column]
+                if values.dtype.kind == "i":
+                    edgelist[column] = pd.to_numeric(values, downcast="integer")
+                elif values.dtype.kind == "u":
+                    edgelist[column] = pd.to_numeric(values, downcast="unsigned")
+                elif values.dtype == object:
+                    edgelist[column] = values.astype("category")
         self._edge_df = edgelist
         self._edge_df_source_column = source_column
         self._edge_df_target_column = target_column
+        self._out_rows = None
+        self._src = self._tgt = None
+        self._columns = None
+        self._pending_edges = []
+        self._node_set = None
+        self._edge_cache.clear()
+        self._adjacency()
 
         return {
             "edge_duration": time.time() - edge_tic,
         }
+
+    def freeze(self):
+        """
+        Get a read-only CSR snapshot of this graph, optimized for reads.
+
+        The CSR arrays are built straight from the source and target columns,
+        with one factorize and one sort, rather than edge by edge.
+
+        Arguments:
+            None
+
+        Returns:
+            FrozenBackend: A new, immutable backend
+
+        """
+        from ._frozen import FrozenBackend
+
+        src, tgt = self._endpoints()
+        known = self._node_index or []
+        # Number the nodes: those in the node table first, in order, then
+        # any that only appear in the edge table.
+        codes, nodes = pd.factorize(
+            np.concatenate(
+                [
+                    np.fromiter(known, dtype=object, count=len(known)),
+                    src.astype(object),
+                    tgt.astype(object),
+                ]
+            ),
+            use_na_sentinel=False,
+        )
+        sources = codes[len(known) : len(known) + len(src)]
+        targets = codes[len(known) + len(src) :]
+
+        edge_metadata = self._edge_metadata()
+
+        if not self._directed:
+            # Store each undirected edge in both directions (self-loops once):
+            reverse = np.flatnonzero(sources != targets)
+            sources, targets = (
+                np.concatenate([sources, targets[reverse]]),
+                np.concatenate([targets, sources[reverse]]),
+            )
+            edge_metadata += [edge_metadata[i] for i in reverse.tolist()]
+
+        order = np.argsort(sources, kind="stable")
+        indptr = np.concatenate(
+            ([0], np.bincount(sources, minlength=len(nodes)))
+        ).cumsum()
+        node_metadata = []
+        if known:
+            node_metadata = [m for _, m in self.all_nodes_as_iterable(True)]
+        node_metadata += [{} for _ in range(len(nodes) - len(node_metadata))]
+        return FrozenBackend(
+            self._directed,
+            nodes.tolist(),
+            node_metadata,
+            indptr,
+            targets[order],
+            [edge_metadata[i] for i in order.tolist()],
+        )
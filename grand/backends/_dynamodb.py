@@ -1,16 +1,84 @@
-from typing import Collection, Hashable, Optional
+from typing import Collection, Hashable, Iterable, Optional
+import os
 import time
+import queue
+import threading
+import weakref
 import concurrent.futures
 
+import cachetools
+import numpy as np
 import pandas as pd
 import boto3
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
+from botocore.credentials import ReadOnlyCredentials
+from botocore.exceptions import ClientError
 
 from .backend import Backend
 
 
 _DEFAULT_DYNAMODB_URL = "http://localhost:4566"
-_N_PARALLEL_REQUESTS = 16
+# Requests are I/O-bound, so use more threads than cores (as many as
+# ThreadPoolExecutor's own default, without the +4 for CPU-bound work):
+_DEFAULT_PARALLEL_REQUESTS = min(32, (os.cpu_count() or 1) * 5)
+# The most items DynamoDB accepts in one BatchWriteItem request:
+_BATCH_WRITE_SIZE = 25
+_MAX_BATCH_WRITE_BACKOFF = 2.0
+# Global secondary indexes on the edge table's endpoint attributes:
+_SOURCE_INDEX_NAME = "BySource"
+_TARGET_INDEX_NAME = "ByTarget"
+# How many node IDs to remember as existing, to skip GetItem calls:
+_KNOWN_NODES_CACHE_SIZE = 100_000
+# How many get_node_by_id results to keep, to skip GetItem calls:
+_NODE_METADATA_CACHE_SIZE = 4096
+# DynamoDB only refreshes a table's ItemCount about every six hours, so there
+# is no point in asking for it more often than that:
+_ITEM_COUNT_TTL = 6 * 60 * 60
+
+
+def _dynamo_config(max_pool_connections: int) -> Config:
+    # Keep one HTTP connection per parallel request (botocore's default pool
+    # only has 10), and let botocore rate-limit itself when throttled:
+    return Config(
+        max_pool_connections=max_pool_connections,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+    )
+
+
+# Clients shared by backends with the same endpoint, credentials and pool
+# size. Entries (and the credentials in them) go away with the last backend
+# that uses the client:
+_dynamo_clients = weakref.WeakValueDictionary()
+_dynamo_clients_lock = threading.Lock()
+
+
+def _get_dynamo_client(
+    dynamodb_url: str,
+    credentials: ReadOnlyCredentials,
+    max_pool_connections: int,
+):
+    """
+    Get a DynamoDB client, shared by all live backends with the same endpoint.
+
+    Creating a boto3 client is slow, so one is shared between backends.
+    Unlike boto3 resources, clients are thread-safe.
+
+    """
+    key = (dynamodb_url, credentials, max_pool_connections)
+    with _dynamo_clients_lock:
+        client = _dynamo_clients.get(key)
+        if client is None:
+            client = boto3.client(
+                "dynamodb",
+                endpoint_url=dynamodb_url,
+                aws_access_key_id=credentials.access_key,
+                aws_secret_access_key=credentials.secret_key,
+                aws_session_token=credentials.token,
+                config=_dynamo_config(max_pool_connections),
+            )
+            _dynamo_clients[key] = client
+    return client
 
 
 def _dynamo_table_exists(table_name: str, client: boto3.client):
@@ -30,10 +98,32 @@ def _create_dynamo_table(
     primary_key: str,
     client,
     read_write_units: Optional[int] = None,
+    indexes: Optional[dict] = None,
 ):
+    """
+    Create a DynamoDB table keyed on a string primary key.
+
+    Arguments:
+        indexes (dict: None): An optional mapping of index name to attribute
+            name. Each entry becomes a global secondary index with that
+            (string) attribute as its partition key.
+
+    """
     if read_write_units is not None:
         raise NotImplementedError("Non-on-demand billing is not currently supported.")
 
+    indexes = indexes or {}
+    kwargs = {}
+    if indexes:
+        kwargs["GlobalSecondaryIndexes"] = [
+            {
+                "IndexName": index_name,
+                "KeySchema": [{"AttributeName": attribute, "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "ALL"},
+            }
+            for index_name, attribute in indexes.items()
+        ]
+
     return client.create_table(
         TableName=table_name,
         KeySchema=[
@@ -41,10 +131,11 @@ def _create_dynamo_table(
             # {"AttributeName": "title", "KeyType": "RANGE"},  # Sort key
         ],
         AttributeDefinitions=[
-            {"AttributeName": primary_key, "AttributeType": "S"},
-            # {"AttributeName": "title", "AttributeType": "S"},
+            {"AttributeName": attribute, "AttributeType": "S"}
+            for attribute in [primary_key, *indexes.values()]
         ],
         BillingMode="PAY_PER_REQUEST",
+        **kwargs,
     )
 
 
@@ -63,6 +154,7 @@ class DynamoDBBackend(Backend):
         aws_access_key_id: str = "",
         aws_secret_access_key: str = "",
         primary_key: str = "ID",
+        max_parallel_requests: int = None,
     ) -> None:
         """
         Create a new dynamodb-backed graph store.
@@ -76,27 +168,43 @@ class DynamoDBBackend(Backend):
                 DynamoDB resource. Defaults to AWS us-east-1.
             primary_key (str: "ID"): The default primary key to use for the
                 tables. Note that this key cannot exist in your metadata dicts.
+            max_parallel_requests (int: None): How many requests to send at
+                once when writing or scanning in bulk. Defaults to
+                _DEFAULT_PARALLEL_REQUESTS.
 
         """
         self._directed = directed
         self._node_table_name = node_table_name or "grand_Nodes"
         self._edge_table_name = edge_table_name or "grand_Edges"
 
+        self._max_parallel_requests = (
+            max_parallel_requests or _DEFAULT_PARALLEL_REQUESTS
+        )
+
         self._primary_key = primary_key
         self._edge_source_key = "Source"
         self._edge_target_key = "Target"
+        # The attributes needed to identify an edge, without its metadata:
+        self._edge_key_attributes = [
+            self._primary_key,
+            self._edge_source_key,
+            self._edge_target_key,
+        ]
 
-        self._resource = boto3.resource(
-            "dynamodb",
-            endpoint_url=dynamodb_url,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
+        credentials = ReadOnlyCredentials(
+            aws_access_key_id, aws_secret_access_key, None
         )
-        self._client = boto3.client(
+        self._client = _get_dynamo_client(
+            dynamodb_url, credentials, self._max_parallel_requests
+        )
+        # Resources are not thread-safe, so each backend has its own. Work
+        # that runs in parallel uses the resource's (thread-safe) client:
+        self._resource = boto3.resource(
             "dynamodb",
             endpoint_url=dynamodb_url,
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
+            config=_dynamo_config(self._max_parallel_requests),
         )
 
         if not _dynamo_table_exists(self._node_table_name, self._client):
@@ -111,7 +219,13 @@ class DynamoDBBackend(Backend):
 
         if not _dynamo_table_exists(self._edge_table_name, self._client):
             edge_creation_response = _create_dynamo_table(
-                self._edge_table_name, self._primary_key, self._resource
+                self._edge_table_name,
+                self._primary_key,
+                self._resource,
+                indexes={
+                    _SOURCE_INDEX_NAME: self._edge_source_key,
+                    _TARGET_INDEX_NAME: self._edge_target_key,
+                },
             )
             # Await table creation:
             if edge_creation_response:
@@ -122,6 +236,19 @@ class DynamoDBBackend(Backend):
         self._node_table = self._resource.Table(self._node_table_name)
         self._edge_table = self._resource.Table(self._edge_table_name)
 
+        # Edge tables created by older versions have no endpoint indexes, in
+        # which case neighbor lookups fall back to filtered scans:
+        self._edge_indexes = {
+            index["IndexName"]
+            for index in self._edge_table.global_secondary_indexes or []
+        }
+        # IDs (as stored, i.e. strings) of nodes known to exist in the table:
+        self._known_nodes = cachetools.LRUCache(maxsize=_KNOWN_NODES_CACHE_SIZE)
+        # Metadata of recently read nodes, dropped whenever a node is written:
+        self._node_metadata = cachetools.LRUCache(maxsize=_NODE_METADATA_CACHE_SIZE)
+        # ItemCount of each table, by table name:
+        self._item_counts = cachetools.TTLCache(maxsize=2, ttl=_ITEM_COUNT_TTL)
+
     def is_directed(self) -> bool:
         """
         Return True if the backend graph is directed.
@@ -143,6 +270,9 @@ class DynamoDBBackend(Backend):
         if yes_i_am_sure:
             self._node_table.delete()
             self._edge_table.delete()
+            self._known_nodes.clear()
+            self._node_metadata.clear()
+            self._item_counts.clear()
 
     def add_node(self, node_name: Hashable, metadata: dict) -> Hashable:
         """
@@ -160,22 +290,177 @@ class DynamoDBBackend(Backend):
         """
         metadata[self._primary_key] = str(node_name)
         response = self._node_table.put_item(Item=metadata)
+        self._known_nodes[str(node_name)] = True
+        self._node_metadata.pop(str(node_name), None)
+        self._item_counts.pop(self._node_table_name, None)
 
         return response
 
-    def _scan_table(self, table, scan_kwargs: dict = None):
-        done = False
-        start_key = None
-        results = []
-        scan_kwargs = scan_kwargs or {}
-        while not done:
-            if start_key:
-                scan_kwargs["ExclusiveStartKey"] = start_key
-            response = table.scan(**scan_kwargs)
-            results += response.get("Items", [])
-            start_key = response.get("LastEvaluatedKey", None)
-            done = start_key is None
-        return results
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        """
+        Add nodes to the graph.
+
+        Nodes are written to the nodes table with a single batch writer,
+        rather than one PutItem request per node.
+
+        Arguments:
+            nodes_for_adding: iterable of nodes or (node, metadata) tuples
+            attr: additional attributes to set on every node
+
+        """
+        with self._node_table.batch_writer() as batch_writer:
+            for n in nodes_for_adding:
+                # Like networkx, treat unhashable items as (node, metadata) pairs:
+                try:
+                    hash(n)
+                    node, metadata = n, {}
+                except TypeError:
+                    node, metadata = n
+                batch_writer.put_item(
+                    Item={**attr, **metadata, self._primary_key: str(node)}
+                )
+                self._known_nodes[str(node)] = True
+                self._node_metadata.pop(str(node), None)
+        self._item_counts.pop(self._node_table_name, None)
+
+    def _batch_put_items(self, table_name: str, items: list):
+        """
+        Write items to a table with parallel BatchWriteItem requests.
+
+        Items are split into chunks of `_BATCH_WRITE_SIZE` and each chunk is
+        sent from a thread pool, retrying any UnprocessedItems with an
+        exponential backoff. Items with the same primary key are written
+        once (the last one wins), since DynamoDB rejects a batch containing
+        duplicate keys.
+
+        Arguments:
+            table_name (str): The name of the table to write to
+            items (list): The items (dicts) to put
+
+        Returns:
+            None
+
+        """
+        self._item_counts.pop(table_name, None)
+        items = list({item[self._primary_key]: item for item in items}.values())
+        chunks = [
+            items[i : i + _BATCH_WRITE_SIZE]
+            for i in range(0, len(items), _BATCH_WRITE_SIZE)
+        ]
+        # Unlike the resource and its batch_writer, the client is thread-safe:
+        client = self._resource.meta.client
+
+        def write_chunk(chunk):
+            request_items = {
+                table_name: [{"PutRequest": {"Item": item}} for item in chunk]
+            }
+            backoff = 0.05
+            while request_items:
+                try:
+                    response = client.batch_write_item(RequestItems=request_items)
+                    request_items = response.get("UnprocessedItems")
+                except ClientError as error:
+                    # Back off and retry the whole chunk if the table is over
+                    # capacity (after botocore's own retries gave up):
+                    if (
+                        error.response["Error"]["Code"]
+                        != "ProvisionedThroughputExceededException"
+                    ):
+                        raise
+                if request_items:
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, _MAX_BATCH_WRITE_BACKOFF)
+
+        if not chunks:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            min(self._max_parallel_requests, len(chunks))
+        ) as executor:
+            list(executor.map(write_chunk, chunks))
+
+    def _scan_table(
+        self,
+        table,
+        scan_kwargs: dict = None,
+        total_segments: int = None,
+    ):
+        """
+        Scan a table with a parallel, segmented Scan.
+
+        Each of the `total_segments` segments is paginated in its own thread,
+        and items are yielded page by page as they arrive. At most one page
+        per segment is buffered, so the whole table is never held in memory
+        at once.
+
+        Arguments:
+            table: The DynamoDB table resource to scan
+            scan_kwargs (dict: None): Extra arguments for each Scan request
+            total_segments (int: None): How many segments to scan in
+                parallel. Defaults to the backend's max_parallel_requests.
+
+        Returns:
+            Generator: The items in the table (arbitrary sort)
+
+        """
+        total_segments = total_segments or self._max_parallel_requests
+        # Unlike the table resource, the client is thread-safe:
+        client = table.meta.client
+        # Bounded, so that threads wait for a slow consumer rather than
+        # buffering the table:
+        pages = queue.Queue(maxsize=total_segments)
+        stop = threading.Event()
+
+        def put(page) -> bool:
+            # Wait for room in the queue, unless the consumer has stopped:
+            while not stop.is_set():
+                try:
+                    pages.put(page, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def scan_segment(segment):
+            kwargs = {
+                **(scan_kwargs or {}),
+                "TableName": table.name,
+                "Segment": segment,
+                "TotalSegments": total_segments,
+            }
+            try:
+                while not stop.is_set():
+                    response = client.scan(**kwargs)
+                    if not put(response.get("Items", [])):
+                        break
+                    start_key = response.get("LastEvaluatedKey", None)
+                    if start_key is None:
+                        break
+                    kwargs["ExclusiveStartKey"] = start_key
+            finally:
+                # Signal that this segment is done:
+                put(None)
+
+        with concurrent.futures.ThreadPoolExecutor(total_segments) as executor:
+            futures = [
+                executor.submit(scan_segment, segment)
+                for segment in range(total_segments)
+            ]
+            try:
+                remaining = total_segments
+                while remaining:
+                    page = pages.get()
+                    if page is None:
+                        remaining -= 1
+                    else:
+                        yield from page
+            finally:
+                stop.set()
+                # Free any threads waiting to put a page:
+                while not pages.empty():
+                    pages.get_nowait()
+            for future in futures:
+                # Raise any error from the scanning threads:
+                future.result()
 
     def all_nodes_as_iterable(self, include_metadata: bool = False) -> Collection:
         """
@@ -189,7 +474,7 @@ class DynamoDBBackend(Backend):
             Generator: A generator of all nodes (arbitrary sort)
 
         """
-        return [
+        return (
             (
                 (
                     node[self._primary_key],
@@ -198,8 +483,11 @@ class DynamoDBBackend(Backend):
                 if include_metadata
                 else node[self._primary_key]
             )
-            for node in self._scan_table(self._node_table)
-        ]
+            for node in self._scan_table(
+                self._node_table,
+                self._projection(None if include_metadata else [self._primary_key]),
+            )
+        )
 
     def has_node(self, u: Hashable) -> bool:
         """
@@ -211,11 +499,14 @@ class DynamoDBBackend(Backend):
         Returns:
             bool: True if the node exists
         """
-        try:
-            self._node_table.get_item(u)
+        key = str(u)
+        if key in self._known_nodes:
             return True
-        except:
+        response = self._node_table.get_item(Key={self._primary_key: key})
+        if "Item" not in response:
             return False
+        self._known_nodes[key] = True
+        return True
 
     def add_edge(self, u: Hashable, v: Hashable, metadata: dict):
         """
@@ -238,25 +529,68 @@ class DynamoDBBackend(Backend):
             raise KeyError(
                 f"'{self._edge_source_key}' should not be in metadata. I need that for PK!"
             )
-        metadata[self._edge_source_key] = u
+        metadata[self._edge_source_key] = str(u)
         if self._edge_target_key in metadata:
             raise KeyError(
                 f"'{self._edge_target_key}' should not be in metadata. I need that for PK!"
             )
-        metadata[self._edge_target_key] = v
+        metadata[self._edge_target_key] = str(v)
 
-        if not self.has_node(u):
-            self._node_table.put_item(Item={self._primary_key: u})
-        if not self.has_node(v):
-            self._node_table.put_item(Item={self._primary_key: v})
+        # Only create endpoints that are missing, so that existing node
+        # metadata is not overwritten:
+        for node in (u, v):
+            if not self.has_node(node):
+                self._node_table.put_item(Item={self._primary_key: str(node)})
+                self._known_nodes[str(node)] = True
+                self._node_metadata.pop(str(node), None)
+                self._item_counts.pop(self._node_table_name, None)
 
         response = self._edge_table.put_item(Item=metadata)
+        self._item_counts.pop(self._edge_table_name, None)
 
         return response
 
+    def add_edges_from(self, ebunch_to_add, **attr):
+        """
+        Add new edges to the graph.
+
+        Edges, and any endpoints that do not exist yet, are written with
+        parallel BatchWriteItem requests rather than one PutItem per edge.
+
+        Arguments:
+            ebunch_to_add: iterable of (source, target, metadata) tuples
+            attr: additional attributes to set on every edge
+
+        """
+        edges = []
+        endpoints = {}
+        for u, v, metadata in ebunch_to_add:
+            item = {**attr, **metadata}
+            for key in (self._edge_source_key, self._edge_target_key):
+                if key in item:
+                    raise KeyError(
+                        f"'{key}' should not be in metadata. I need that for PK!"
+                    )
+            item[self._primary_key] = f"__{u}__{v}"
+            item[self._edge_source_key] = str(u)
+            item[self._edge_target_key] = str(v)
+            edges.append(item)
+            endpoints[str(u)] = endpoints[str(v)] = None
+
+        # Only create endpoints that are missing, so that existing node
+        # metadata is not overwritten:
+        new_nodes = [node for node in endpoints if not self.has_node(node)]
+        self._batch_put_items(
+            self._node_table_name, [{self._primary_key: node} for node in new_nodes]
+        )
+        for node in new_nodes:
+            self._known_nodes[node] = True
+            self._node_metadata.pop(node, None)
+        self._batch_put_items(self._edge_table_name, edges)
+
     def all_edges_as_iterable(self, include_metadata: bool = False) -> Collection:
         """
-        Get a list of all edges in this graph, arbitrary sort.
+        Get a generator of all edges in this graph, arbitrary sort.
 
         Arguments:
             include_metadata (bool: False): Whether to include edge metadata
@@ -265,14 +599,19 @@ class DynamoDBBackend(Backend):
             Generator: A generator of all edges (arbitrary sort)
 
         """
-        return [
+        return (
             (
                 (edge[self._edge_source_key], edge[self._edge_target_key], edge)
                 if include_metadata
                 else (edge[self._edge_source_key], edge[self._edge_target_key])
             )
-            for edge in self._scan_table(self._edge_table)
-        ]
+            for edge in self._scan_table(
+                self._edge_table,
+                self._projection(
+                    None if include_metadata else self._edge_key_attributes
+                ),
+            )
+        )
 
     def get_node_by_id(self, node_name: Hashable):
         """
@@ -285,11 +624,15 @@ class DynamoDBBackend(Backend):
             dict: The metadata associated with this node
 
         """
-        response = self._node_table.get_item(Key={self._primary_key: node_name})
-
-        item = response["Item"]
-        item.pop(self._primary_key)
-        return item
+        key = str(node_name)
+        if key not in self._node_metadata:
+            response = self._node_table.get_item(Key={self._primary_key: key})
+            item = response["Item"]
+            item.pop(self._primary_key)
+            self._node_metadata[key] = item
+            self._known_nodes[key] = True
+        # Return a copy, so callers cannot change the cached metadata:
+        return dict(self._node_metadata[key])
 
     def get_edge_by_id(self, u: Hashable, v: Hashable):
         """
@@ -310,6 +653,116 @@ class DynamoDBBackend(Backend):
         item.pop(self._edge_target_key)
         return item
 
+    def _projection(self, attributes: Optional[Collection[str]]) -> dict:
+        # Request arguments that only return the given attributes (or all of
+        # them, if None), to cut the bytes sent over the wire:
+        if attributes is None:
+            return {}
+        names = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+        return {
+            "ProjectionExpression": ", ".join(names),
+            "ExpressionAttributeNames": names,
+        }
+
+    def _query_index(
+        self,
+        index_name: str,
+        key: str,
+        value: str,
+        attributes: Optional[Collection[str]] = None,
+    ):
+        # Use the (thread-safe) client, since queries may run in parallel:
+        client = self._edge_table.meta.client
+        query_kwargs = {
+            "TableName": self._edge_table_name,
+            "IndexName": index_name,
+            "KeyConditionExpression": Key(key).eq(value),
+            **self._projection(attributes),
+        }
+        while True:
+            response = client.query(**query_kwargs)
+            yield from response.get("Items", [])
+            start_key = response.get("LastEvaluatedKey", None)
+            if start_key is None:
+                break
+            query_kwargs["ExclusiveStartKey"] = start_key
+
+    def _incident_edges(
+        self,
+        u: str,
+        outgoing: bool,
+        incoming: bool,
+        attributes: Optional[Collection[str]] = None,
+    ) -> Iterable:
+        """
+        Get the edge items that start (outgoing) and/or end (incoming) at u.
+
+        Each direction is a Query against the matching endpoint index; when
+        both are requested the two queries run in parallel. Edge tables
+        without those indexes are scanned instead.
+
+        Arguments:
+            u (str): The node ID, as stored
+            outgoing (bool): Whether to include edges for which u is the source
+            incoming (bool): Whether to include edges for which u is the target
+            attributes (Collection[str]: None): The attributes to fetch for
+                each edge, or None for all of them. This must include the
+                primary key when both directions are requested.
+
+        Returns:
+            Iterable: The edge items, each included once
+
+        """
+        lookups = []
+        if outgoing:
+            lookups.append((_SOURCE_INDEX_NAME, self._edge_source_key))
+        if incoming:
+            lookups.append((_TARGET_INDEX_NAME, self._edge_target_key))
+
+        if not all(index_name in self._edge_indexes for index_name, _ in lookups):
+            condition = None
+            for _, key in lookups:
+                condition = (
+                    Key(key).eq(u) if condition is None else condition | Key(key).eq(u)
+                )
+            return self._scan_table(
+                self._edge_table,
+                {"FilterExpression": condition, **self._projection(attributes)},
+            )
+
+        if len(lookups) == 1:
+            return self._query_index(*lookups[0], u, attributes)
+
+        with concurrent.futures.ThreadPoolExecutor(len(lookups)) as executor:
+            responses = list(
+                executor.map(
+                    lambda lookup: list(self._query_index(*lookup, u, attributes)),
+                    lookups,
+                )
+            )
+        # Self-loops are returned by both queries:
+        return list(
+            {
+                item[self._primary_key]: item
+                for response in responses
+                for item in response
+            }.values()
+        )
+
+    def _unique_neighbors(self, u: str, edges: Iterable):
+        # Undirected graphs may store both (u, v) and (v, u), so yield each
+        # neighbor only once:
+        seen = set()
+        for edge in edges:
+            neighbor = (
+                edge[self._edge_source_key]
+                if edge[self._edge_source_key] != u
+                else edge[self._edge_target_key]
+            )
+            if neighbor not in seen:
+                seen.add(neighbor)
+                yield neighbor
+
     def get_node_neighbors(
         self, u: Hashable, include_metadata: bool = False
     ) -> Collection:
@@ -323,25 +776,14 @@ class DynamoDBBackend(Backend):
             Generator
 
         """
-        if self._directed:
-            # Return only edges for which `u` is the source
-            res = self._scan_table(
-                self._edge_table,
-                {
-                    "FilterExpression": Key(self._primary_key).begins_with(f"__{u}__"),
-                },
-            )
-
-        else:
-            res = self._scan_table(
-                self._edge_table,
-                {
-                    "FilterExpression": (
-                        Key(self._edge_source_key).eq(u)
-                        | Key(self._edge_target_key).eq(u)
-                    ),
-                },
-            )
+        # Return only edges for which `u` is the source, if directed:
+        u = str(u)
+        res = self._incident_edges(
+            u,
+            outgoing=True,
+            incoming=not self._directed,
+            attributes=None if include_metadata else self._edge_key_attributes,
+        )
 
         if include_metadata:
             results = {}
@@ -356,16 +798,7 @@ class DynamoDBBackend(Backend):
                 item.pop(self._edge_target_key)
                 results[key] = item
             return results
-        return iter(
-            [
-                (
-                    edge[self._edge_source_key]
-                    if edge[self._edge_source_key] != u
-                    else edge[self._edge_target_key]
-                )
-                for edge in res
-            ]
-        )
+        return self._unique_neighbors(u, res)
 
     def get_node_predecessors(
         self, u: Hashable, include_metadata: bool = False
@@ -380,25 +813,14 @@ class DynamoDBBackend(Backend):
             Generator
 
         """
-        if self._directed:
-            # Return only edges for which `u` is the target
-            res = self._scan_table(
-                self._edge_table,
-                {
-                    "FilterExpression": Key(self._edge_target_key).eq(u),
-                },
-            )
-
-        else:
-            res = self._scan_table(
-                self._edge_table,
-                {
-                    "FilterExpression": (
-                        Key(self._edge_source_key).eq(u)
-                        | Key(self._edge_target_key).eq(u)
-                    ),
-                },
-            )
+        # Return only edges for which `u` is the target, if directed:
+        u = str(u)
+        res = self._incident_edges(
+            u,
+            outgoing=not self._directed,
+            incoming=True,
+            attributes=None if include_metadata else self._edge_key_attributes,
+        )
 
         if include_metadata:
             results = {}
@@ -413,21 +835,16 @@ class DynamoDBBackend(Backend):
                 item.pop(self._edge_target_key)
                 results[key] = item
             return results
-        return iter(
-            [
-                (
-                    edge[self._edge_source_key]
-                    if edge[self._edge_source_key] != u
-                    else edge[self._edge_target_key]
-                )
-                for edge in res
-            ]
-        )
+        return self._unique_neighbors(u, res)
 
     def get_node_count(self) -> int:
         """
         Get an integer count of the number of nodes in this graph.
 
+        This is the table's ItemCount, which DynamoDB only updates about every
+        six hours, so it may not include recent writes. The cached count is
+        dropped whenever this backend writes to the table.
+
         Arguments:
             None
 
@@ -435,14 +852,16 @@ class DynamoDBBackend(Backend):
             int: The count of nodes
 
         """
-        return self._client.describe_table(TableName=self._node_table_name)["Table"][
-            "ItemCount"
-        ]
+        return self._item_count(self._node_table_name)
 
     def get_edge_count(self) -> int:
         """
         Get an integer count of the number of edges in this graph.
 
+        This is the table's ItemCount, which DynamoDB only updates about every
+        six hours, so it may not include recent writes. The cached count is
+        dropped whenever this backend writes to the table.
+
         Arguments:
             None
 
@@ -450,9 +869,16 @@ class DynamoDBBackend(Backend):
             int: The count of edges
 
         """
-        return self._client.describe_table(TableName=self._edge_table_name)["Table"][
-            "ItemCount"
-        ]
+        return self._item_count(self._edge_table_name)
+
+    def _item_count(self, table_name: str) -> int:
+        count = self._item_counts.get(table_name)
+        if count is None:
+            count = self._client.describe_table(TableName=table_name)["Table"][
+                "ItemCount"
+            ]
+            self._item_counts[table_name] = count
+        return count
 
     # Ingesting
 
@@ -464,65 +890,41 @@ class DynamoDBBackend(Backend):
 
         """
         # Ingest edges first:
-
-        edge_column_names = [
-            c for c in edgelist.columns if c not in [source_column, target_column]
-        ]
-
         tic = time.time()
-        with self._edge_table.batch_writer() as batch_writer:
-
-            with concurrent.futures.ThreadPoolExecutor(
-                _N_PARALLEL_REQUESTS
-            ) as executor:
-                result_futures = list(
-                    map(
-                        lambda i: executor.submit(
-                            lambda: batch_writer.put_item(
-                                Item={
-                                    self._primary_key: f"__{edgelist._get_value(i, source_column)}__{edgelist._get_value(i, target_column)}",
-                                    self._edge_source_key: edgelist._get_value(
-                                        i, source_column
-                                    ),
-                                    self._edge_target_key: edgelist._get_value(
-                                        i, target_column
-                                    ),
-                                    **{
-                                        col: edgelist._get_value(i, col)
-                                        for col in edge_column_names
-                                    },
-                                }
-                            )
-                        ),
-                        edgelist.index,
-                    )
-                )
-                for future in concurrent.futures.as_completed(result_futures):
-                    future.result()
-
-            # for edge in edges:
-            #     batch_writer.put_item(Item=edge)
+        # Build the primary key column in one vectorized pass, and let
+        # to_dict turn the rows into items (with native Python scalars):
+        edges = edgelist.rename(
+            columns={
+                source_column: self._edge_source_key,
+                target_column: self._edge_target_key,
+            }
+        )
+        # Endpoints are stored as strings, like node IDs, since they are the
+        # keys of the edge table's secondary indexes:
+        edges[self._edge_source_key] = edges[self._edge_source_key].astype(str)
+        edges[self._edge_target_key] = edges[self._edge_target_key].astype(str)
+        edges[self._primary_key] = (
+            "__" + edges[self._edge_source_key] + "__" + edges[self._edge_target_key]
+        )
+        self._batch_put_items(self._edge_table_name, edges.to_dict(orient="records"))
         edge_toc = time.time() - tic
 
         tic = time.time()
         # Construct a unique set of nodes:
-        nodes = edgelist[source_column].append(edgelist[target_column]).unique()
-        with self._node_table.batch_writer() as batch_writer:
-            with concurrent.futures.ThreadPoolExecutor(
-                _N_PARALLEL_REQUESTS
-            ) as executor:
-                result_futures = list(
-                    map(
-                        lambda x: executor.submit(
-                            lambda: batch_writer.put_item(
-                                Item={self._primary_key: str(x)}
-                            )
-                        ),
-                        nodes,
-                    )
-                )
-                for future in concurrent.futures.as_completed(result_futures):
-                    future.result()
+        nodes = pd.unique(
+            np.concatenate(
+                [
+                    edgelist[source_column].to_numpy(),
+                    edgelist[target_column].to_numpy(),
+                ]
+            )
+        )
+        self._batch_put_items(
+            self._node_table_name, [{self._primary_key: str(x)} for x in nodes]
+        )
+        for x in nodes:
+            self._known_nodes[str(x)] = True
+            self._node_metadata.pop(str(x), None)
 
         return {
             "node_count": len(nodes),
@@ -0,0 +1,402 @@
+from types import MappingProxyType
+from typing import Hashable, Generator, List, Mapping, Sequence
+
+import numpy as np
+
+from .backend import Backend
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    # A view of `array` that cannot be written to:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class FrozenBackend(Backend):
+    """
+    A read-only snapshot of a graph, stored in compressed sparse row (CSR) form.
+
+    Nodes are numbered by their position in the snapshot, and the neighbors of
+    the node at position `i` are `indices[indptr[i]:indptr[i + 1]]`. Neighbors
+    are sorted within each row, so edge lookups are a binary search. Undirected
+    edges are stored in both directions, like networkx's adjacency dicts.
+
+    You probably want to create one of these with `Backend.freeze()` rather
+    than calling this constructor directly. Metadata dictionaries are shared
+    with the backend that was frozen, not copied.
+
+    """
+
+    def __init__(
+        self,
+        directed: bool,
+        nodes: Sequence[Hashable],
+        node_metadata: Sequence[dict],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        edge_metadata: Sequence[dict],
+    ):
+        """
+        Create a new FrozenBackend from CSR arrays.
+
+        Arguments:
+            directed (bool): Whether the graph is directed
+            nodes (Sequence[Hashable]): The node IDs, in position order
+            node_metadata (Sequence[dict]): The metadata of each node, in the
+                same order as `nodes`
+            indptr (np.ndarray): CSR row pointers, of length len(nodes) + 1
+            indices (np.ndarray): CSR column indices (node positions)
+            edge_metadata (Sequence[dict]): The metadata of each entry in
+                `indices`, in the same order
+
+        Returns:
+            None
+
+        """
+        self._directed = directed
+        self._nodes = tuple(nodes)
+        self._node_metadata = list(node_metadata)
+        self._iloc = {node: i for i, node in enumerate(self._nodes)}
+
+        indptr = np.asarray(indptr, dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64)
+        rows = np.repeat(np.arange(len(self._nodes), dtype=np.int64), np.diff(indptr))
+
+        # Sort neighbors within each row so that edges can be binary-searched:
+        order = np.lexsort((indices, rows))
+        self._indptr = indptr
+        self._indices = indices[order]
+        self._edge_metadata = [edge_metadata[i] for i in order.tolist()]
+
+        if directed:
+            # Build the transposed CSR for predecessor lookups. Positions in
+            # `_in_edges` point back into `_indices` / `_edge_metadata`:
+            rows = rows[order]
+            in_order = np.lexsort((rows, self._indices))
+            self._in_indptr = np.concatenate(
+                ([0], np.bincount(self._indices, minlength=len(self._nodes)))
+            ).cumsum()
+            self._in_indices = rows[in_order]
+            self._in_edges = in_order
+        else:
+            self._in_indptr = self._indptr
+            self._in_indices = self._indices
+            self._in_edges = np.arange(len(self._indices), dtype=np.int64)
+
+    @property
+    def indptr(self) -> np.ndarray:
+        """
+        The CSR row pointers, as a read-only array of length node count + 1.
+
+        """
+        return _read_only(self._indptr)
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        The CSR column indices (node positions), as a read-only array.
+
+        """
+        return _read_only(self._indices)
+
+    @property
+    def nodes(self) -> tuple:
+        """
+        The node IDs, in position order.
+
+        """
+        return self._nodes
+
+    @property
+    def node_index(self) -> Mapping[Hashable, int]:
+        """
+        A read-only mapping from node ID to position.
+
+        """
+        return MappingProxyType(self._iloc)
+
+    @classmethod
+    def from_backend(cls, backend: Backend) -> "FrozenBackend":
+        """
+        Create a FrozenBackend snapshot of any other backend.
+
+        Arguments:
+            backend (Backend): The backend to snapshot
+
+        Returns:
+            FrozenBackend: The snapshot
+
+        """
+        directed = backend.is_directed()
+        nodes: List[Hashable] = []
+        node_metadata: List[dict] = []
+        iloc = {}
+        for node, metadata in backend.all_nodes_as_iterable(include_metadata=True):
+            iloc[node] = len(nodes)
+            nodes.append(node)
+            node_metadata.append(metadata)
+
+        sources, targets, edge_metadata = [], [], []
+        for u, v, metadata in backend.all_edges_as_iterable(include_metadata=True):
+            for node in (u, v):
+                if node not in iloc:
+                    iloc[node] = len(nodes)
+                    nodes.append(node)
+                    node_metadata.append({})
+            sources.append(iloc[u])
+            targets.append(iloc[v])
+            edge_metadata.append(metadata)
+            if not directed and u != v:
+                sources.append(iloc[v])
+                targets.append(iloc[u])
+                edge_metadata.append(metadata)
+
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind="stable")
+        indptr = np.concatenate(
+            ([0], np.bincount(sources, minlength=len(nodes)))
+        ).cumsum()
+        return cls(
+            directed,
+            nodes,
+            node_metadata,
+            indptr,
+            np.asarray(targets, dtype=np.int64)[order],
+            [edge_metadata[i] for i in order.tolist()],
+        )
+
+    def is_directed(self) -> bool:
+        """
+        Return True if the backend graph is directed.
+
+        Arguments:
+            None
+
+        Returns:
+            bool: True if the backend graph is directed.
+
+        """
+        return self._directed
+
+    def freeze(self) -> "FrozenBackend":
+        """
+        Return this backend, which is already frozen.
+
+        """
+        return self
+
+    def add_node(self, node_name: Hashable, metadata: dict):
+        raise NotImplementedError("A FrozenBackend cannot be modified.")
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        raise NotImplementedError("A FrozenBackend cannot be modified.")
+
+    def add_edge(self, u: Hashable, v: Hashable, metadata: dict):
+        raise NotImplementedError("A FrozenBackend cannot be modified.")
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        raise NotImplementedError("A FrozenBackend cannot be modified.")
+
+    def ingest_from_edgelist_dataframe(self, edgelist, source_column, target_column):
+        raise NotImplementedError("A FrozenBackend cannot be modified.")
+
+    def get_node_by_id(self, node_name: Hashable):
+        """
+        Return the data associated with a node.
+
+        Arguments:
+            node_name (Hashable): The node ID to look up
+
+        Returns:
+            dict: The metadata associated with this node
+
+        """
+        return self._node_metadata[self._iloc[node_name]]
+
+    def all_nodes_as_iterable(self, include_metadata: bool = False) -> Generator:
+        """
+        Get a generator of all of the nodes in this graph.
+
+        Arguments:
+            include_metadata (bool: False): Whether to include node metadata in
+                the response
+
+        Returns:
+            Generator: A generator of all nodes (arbitrary sort)
+
+        """
+        if include_metadata:
+            return zip(self._nodes, self._node_metadata)
+        return iter(self._nodes)
+
+    def has_node(self, u: Hashable) -> bool:
+        """
+        Return true if the node exists in the graph.
+
+        Arguments:
+            u (Hashable): The ID of the node to check
+
+        Returns:
+            bool: True if the node exists
+        """
+        return u in self._iloc
+
+    def all_edges_as_iterable(self, include_metadata: bool = False) -> Generator:
+        """
+        Get a list of all edges in this graph, arbitrary sort.
+
+        Arguments:
+            include_metadata (bool: False): Whether to include edge metadata
+
+        Returns:
+            Generator: A generator of all edges (arbitrary sort)
+
+        """
+        nodes = self._nodes
+        indptr = self._indptr.tolist()
+        indices = self._indices.tolist()
+        for i, u in enumerate(nodes):
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                # Undirected edges are stored twice; only report them once:
+                if not self._directed and j < i:
+                    continue
+                if include_metadata:
+                    yield (u, nodes[j], self._edge_metadata[k])
+                else:
+                    yield (u, nodes[j])
+
+    def _edge_position(self, u: Hashable, v: Hashable) -> int:
+        """
+        Get the position of the edge (u, v) in the CSR arrays.
+
+        Raises:
+            KeyError: If the edge does not exist
+
+        """
+        i, j = self._iloc[u], self._iloc[v]
+        start, end = self._indptr[i], self._indptr[i + 1]
+        k = start + np.searchsorted(self._indices[start:end], j)
+        if k < end and self._indices[k] == j:
+            return k
+        raise KeyError(f"Edge {u}-{v} not found.")
+
+    def has_edge(self, u: Hashable, v: Hashable) -> bool:
+        """
+        Return true if the edge exists in the graph.
+
+        Arguments:
+            u (Hashable): The source node ID
+            v (Hashable): The target node ID
+
+        Returns:
+            bool: True if the edge exists
+        """
+        try:
+            self._edge_position(u, v)
+            return True
+        except KeyError:
+            return False
+
+    def get_edge_by_id(self, u: Hashable, v: Hashable):
+        """
+        Get an edge by its source and target IDs.
+
+        Arguments:
+            u (Hashable): The source node ID
+            v (Hashable): The target node ID
+
+        Returns:
+            dict: Metadata associated with this edge
+
+        """
+        return self._edge_metadata[self._edge_position(u, v)]
+
+    def get_node_neighbors(self, u: Hashable, include_metadata: bool = False):
+        """
+        Get a generator of all downstream nodes from this node.
+
+        Arguments:
+            u (Hashable): The source node ID
+
+        Returns:
+            Generator
+
+        """
+        i = self._iloc[u]
+        start, end = self._indptr[i], self._indptr[i + 1]
+        neighbors = [self._nodes[j] for j in self._indices[start:end].tolist()]
+        if include_metadata:
+            return dict(zip(neighbors, self._edge_metadata[start:end]))
+        return iter(neighbors)
+
+    def get_node_predecessors(self, u: Hashable, include_metadata: bool = False):
+        """
+        Get a generator of all upstream nodes from this node.
+
+        Arguments:
+            u (Hashable): The source node ID
+
+        Returns:
+            Generator
+
+        """
+        i = self._iloc[u]
+        start, end = self._in_indptr[i], self._in_indptr[i + 1]
+        predecessors = [self._nodes[j] for j in self._in_indices[start:end].tolist()]
+        if include_metadata:
+            return {
+                node: self._edge_metadata[k]
+                for node, k in zip(predecessors, self._in_edges[start:end].tolist())
+            }
+        return iter(predecessors)
+
+    def get_node_count(self) -> int:
+        """
+        Get an integer count of the number of nodes in this graph.
+
+        Arguments:
+            None
+
+        Returns:
+            int: The count of nodes
+
+        """
+        return len(self._nodes)
+
+    def get_edge_count(self) -> int:
+        """
+        Get an integer count of the number of edges in this graph.
+
+        Arguments:
+            None
+
+        Returns:
+            int: The count of edges
+
+        """
+        if self._directed:
+            return len(self._indices)
+        rows = np.repeat(np.arange(len(self._nodes)), np.diff(self._indptr))
+        self_loops = int(np.count_nonzero(rows == self._indices))
+        return (len(self._indices) + self_loops) // 2
+
+    def degree(self, u: Hashable) -> int:
+        """
+        Get the degree of a node.
+
+        Arguments:
+            u (Hashable): The node ID
+
+        Returns:
+            int: The degree of the node
+
+        """
+        i = self._iloc[u]
+        return int(self._indptr[i + 1] - self._indptr[i])
+
+    def degrees(self, nbunch=None):
+        if nbunch is None:
+            return dict(zip(self._nodes, np.diff(self._indptr).tolist()))
+        return {node: self.degree(node) for node in nbunch}
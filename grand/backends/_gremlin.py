@@ -4,7 +4,6 @@ https://tinkerpop.apache.org/docs/current/reference/
 
 from typing import Hashable, Collection
 
-import pandas as pd
 from gremlin_python.structure.graph import Graph
 from gremlin_python.process.graph_traversal import __, GraphTraversalSource
 from gremlin_python.driver.driver_remote_connection import DriverRemoteConnection
@@ -1,6 +1,8 @@
 from typing import Hashable, Collection
+import time
 
-from igraph import Graph, InternalError
+from igraph import Graph
+import numpy as np
 import pandas as pd
 
 from .backend import Backend
@@ -14,10 +16,10 @@ def _remove_name_from_attributes(attributes: dict):
 
 class IGraphBackend(Backend):
     """
-    This is currently UNOPTIMIZED CODE.
+    A graph backend that stores structure and metadata in an igraph.Graph.
 
-    Recommendations for future work include improved indexing and caching of
-    node names and metadata.
+    Node names are mapped to igraph vertex IDs with a dictionary, so lookups
+    by name do not have to search the vertex sequence.
 
     """
 
@@ -35,15 +37,85 @@ class IGraphBackend(Backend):
         """
         self._directed = directed
         self._ig = Graph(directed=self._directed)
+        # Node name to igraph vertex ID. Vertices are never removed, so IDs
+        # are stable:
+        self._name_to_vid = {}
 
     def ingest_from_edgelist_dataframe(
         self, edgelist: pd.DataFrame, source_column: str, target_column: str
-    ) -> None:
+    ) -> dict:
         """
         Ingest an edgelist from a Pandas DataFrame.
 
+        New nodes and new edges are added with one bulk call each, and every
+        other column of the DataFrame becomes an edge attribute. As with
+        `add_edge`, rows for an edge that already exists (in the graph or
+        earlier in the DataFrame) update that edge's attributes instead.
+
         """
-        raise NotImplementedError()
+        tic = time.time()
+        codes, nodes = pd.factorize(
+            pd.concat(
+                [edgelist[source_column], edgelist[target_column]], ignore_index=True
+            ),
+            use_na_sentinel=False,
+        )
+        nodes = nodes.tolist()
+        new_nodes = [node for node in nodes if node not in self._name_to_vid]
+        first_vid = self._ig.vcount()
+        self._ig.add_vertices(len(new_nodes), attributes={"name": new_nodes})
+        self._name_to_vid.update(
+            zip(new_nodes, range(first_vid, first_vid + len(new_nodes)))
+        )
+        node_toc = time.time() - tic
+
+        tic = time.time()
+        vids = np.array([self._name_to_vid[node] for node in nodes], dtype=np.int64)
+        sources = vids[codes[: len(edgelist)]]
+        targets = vids[codes[len(edgelist) :]]
+        columns = [
+            column
+            for column in edgelist.columns
+            if column not in [source_column, target_column]
+        ]
+
+        # Rows for the same edge are merged, as add_edge would: the last row
+        # gives the attributes, and the first row gives the direction.
+        if self._directed:
+            keys = sources * self._ig.vcount() + targets
+        else:
+            keys = np.minimum(sources, targets) * self._ig.vcount() + np.maximum(
+                sources, targets
+            )
+        _, first = np.unique(keys, return_index=True)
+        _, last = np.unique(keys[::-1], return_index=True)
+        last = len(keys) - 1 - last
+        order = np.argsort(first)
+        first, last = first[order], last[order]
+
+        pairs = list(zip(sources[first].tolist(), targets[first].tolist()))
+        values = {column: edgelist[column].to_numpy()[last] for column in columns}
+        eids = np.array(self._ig.get_eids(pairs, error=False), dtype=np.int64)
+        new = eids == -1
+        self._ig.add_edges(
+            [pair for pair, is_new in zip(pairs, new.tolist()) if is_new],
+            attributes={column: values[column][new].tolist() for column in columns},
+        )
+        # Update the attributes of edges that were already in the graph:
+        existing = np.flatnonzero(~new)
+        if len(existing):
+            updates = {column: values[column][existing].tolist() for column in columns}
+            for i, eid in enumerate(eids[existing].tolist()):
+                self._ig.es[eid].update_attributes(
+                    {column: updates[column][i] for column in columns}
+                )
+
+        return {
+            "node_count": len(nodes),
+            "node_duration": node_toc,
+            "edge_count": len(edgelist),
+            "edge_duration": time.time() - tic,
+        }
 
     def is_directed(self) -> bool:
         """
@@ -72,10 +144,10 @@ class IGraphBackend(Backend):
         """
         if self.has_node(node_name):
             # Update metadata
-            m = self._ig.vs.find(name=node_name)
-            m.update_attributes(metadata)
+            self._ig.vs[self._name_to_vid[node_name]].update_attributes(metadata)
             return node_name
         self._ig.add_vertex(name=node_name, **metadata)
+        self._name_to_vid[node_name] = self._ig.vcount() - 1
         return node_name
 
     def get_node_by_id(self, node_name: Hashable):
@@ -90,7 +162,7 @@ class IGraphBackend(Backend):
 
         """
         return _remove_name_from_attributes(
-            self._ig.vs.find(name=node_name).attributes()
+            self._ig.vs[self._name_to_vid[node_name]].attributes()
         )
 
     def all_nodes_as_iterable(self, include_metadata: bool = False) -> Collection:
@@ -122,11 +194,7 @@ class IGraphBackend(Backend):
         Returns:
             bool: True if the node exists
         """
-        try:
-            self._ig.vs.find(name=u)
-            return True
-        except:
-            return False
+        return u in self._name_to_vid
 
     def add_edge(self, u: Hashable, v: Hashable, metadata: dict):
         """
@@ -144,16 +212,18 @@ class IGraphBackend(Backend):
             Hashable: The edge ID, as inserted.
 
         """
-        if self.has_edge(u, v):
+        eid = self._get_eid(u, v)
+        if eid != -1:
             # Update metadata
-            e = self._ig.get_eid(u, v)
-            self._ig.es[e].update_attributes(metadata)
+            self._ig.es[eid].update_attributes(metadata)
             return
         if not self.has_node(u):
             self.add_node(u, {})
         if not self.has_node(v):
             self.add_node(v, {})
-        return self._ig.add_edge(source=u, target=v, **metadata)
+        return self._ig.add_edge(
+            source=self._name_to_vid[u], target=self._name_to_vid[v], **metadata
+        )
 
     def all_edges_as_iterable(self, include_metadata: bool = False) -> Collection:
         """
@@ -173,14 +243,14 @@ class IGraphBackend(Backend):
             for e in self._ig.es:
                 yield e.source_vertex["name"], e.target_vertex["name"]
 
+    def _get_eid(self, u: Hashable, v: Hashable) -> int:
+        # The igraph edge ID between two named nodes, or -1 if there is none:
+        if u not in self._name_to_vid or v not in self._name_to_vid:
+            return -1
+        return self._ig.get_eid(self._name_to_vid[u], self._name_to_vid[v], error=False)
+
     def has_edge(self, u, v):
-        try:
-            self._ig.get_eid(u, v)
-            return True
-        except (InternalError, ValueError):
-            # InternalError means no such edge
-            # ValueError means one vertex doesn't exist
-            return False
+        return self._get_eid(u, v) != -1
 
     def get_edge_by_id(self, u: Hashable, v: Hashable):
         """
@@ -194,10 +264,20 @@ class IGraphBackend(Backend):
             dict: Metadata associated with this edge
 
         """
-        try:
-            return self._ig.es[self._ig.get_eid(u, v)].attributes()
-        except InternalError:
+        eid = self._get_eid(u, v)
+        if eid == -1:
             raise IndexError(f"The edge ({u}, {v}) is not in the graph.")
+        return self._ig.es[eid].attributes()
+
+    def _incident_metadata(self, vid: int, mode: str) -> dict:
+        # Map each neighbor's name to the metadata of the edge joining it to
+        # `vid`, walking the incident edges once rather than looking each one
+        # up again with get_eid:
+        results = {}
+        for edge in self._ig.es[self._ig.incident(vid, mode=mode)]:
+            other = edge.target if edge.source == vid else edge.source
+            results[self._ig.vs[other]["name"]] = edge.attributes()
+        return results
 
     def get_node_successors(
         self, u: Hashable, include_metadata: bool = False
@@ -217,13 +297,11 @@ class IGraphBackend(Backend):
             Generator
 
         """
+        vid = self._name_to_vid[u]
         if include_metadata:
-            return {
-                self._ig.vs[s]["name"]: self.get_edge_by_id(u, s)
-                for s in self._ig.successors(u)
-            }
+            return self._incident_metadata(vid, mode="out")
         else:
-            return iter([self._ig.vs[s]["name"] for s in self._ig.successors(u)])
+            return iter([self._ig.vs[s]["name"] for s in self._ig.successors(vid)])
 
     def get_node_predecessors(
         self, u: Hashable, include_metadata: bool = False
@@ -238,13 +316,11 @@ class IGraphBackend(Backend):
             Generator
 
         """
+        vid = self._name_to_vid[u]
         if include_metadata:
-            return {
-                self._ig.vs[s]["name"]: self.get_edge_by_id(s, u)
-                for s in self._ig.predecessors(u)
-            }
+            return self._incident_metadata(vid, mode="in")
         else:
-            return iter([self._ig.vs[s]["name"] for s in self._ig.predecessors(u)])
+            return iter([self._ig.vs[s]["name"] for s in self._ig.predecessors(vid)])
 
     def get_node_count(self) -> int:
         """
@@ -1,5 +1,4 @@
-from typing import Hashable, Generator, Iterable
-import abc
+from typing import Hashable, Generator
 
 import networkit
 import pandas as pd
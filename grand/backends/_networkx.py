@@ -1,26 +1,99 @@
-from typing import Hashable, Collection
+from typing import Any, Hashable, Collection, Iterable, TYPE_CHECKING
 import time
 
-import pandas as pd
 import networkx as nx
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 from .backend import Backend
+from . import _accel
+
+
+def _has_fast_path(graph: nx.Graph) -> bool:
+    """
+    Check whether a networkx graph uses the plain dict-of-dicts layout.
+
+    If it does, NetworkXBackend can write into the graph's dicts directly
+    instead of going through `add_node` / `add_edge` and their kwargs.
+
+    """
+    return all(
+        isinstance(getattr(graph, attr, None), dict)
+        for attr in (
+            ("_node", "_succ", "_pred") if graph.is_directed() else ("_node", "_adj")
+        )
+    )
+
+
+# Whether the installed networkx stores graphs as plain dicts-of-dicts:
+_FAST_PATH = _has_fast_path(nx.Graph()) and _has_fast_path(nx.DiGraph())
+
+
+class _NXGraph(nx.Graph):
+    """
+    The networkx Graph stored by an undirected NetworkXBackend.
+
+    Graph.nx hands this graph out directly, so it also provides the
+    `add_node_fast` / `add_edge_fast` methods of NetworkXDialect, which take
+    a metadata dict instead of keyword arguments.
+
+    """
+
+    add_node_fast = _accel.undirected_add_node
+    add_edge_fast = _accel.undirected_add_edge
+
+    @property
+    def _nx_graph(self):
+        # The _accel functions look up the graph on their first argument.
+        return self
+
+
+class _NXDiGraph(nx.DiGraph):
+    """
+    The networkx DiGraph stored by a directed NetworkXBackend.
+
+    See _NXGraph.
+
+    """
+
+    add_node_fast = _accel.directed_add_node
+    add_edge_fast = _accel.directed_add_edge
+
+    @property
+    def _nx_graph(self):
+        return self
 
 
 class NetworkXBackend(Backend):
-    def __init__(self, directed: bool = False):
+    __slots__ = ("_nx_graph", "_directed", "_attr_index")
+
+    def __new__(cls, directed: bool = False, *args, **kwargs):
+        # Pick a backend specialized for directed or undirected graphs once,
+        # here, so that add_node / add_edge don't branch on every call. (The
+        # specialized backends don't maintain attribute indexes.)
+        indexed_attrs = args[0] if args else kwargs.get("indexed_attrs")
+        if cls is NetworkXBackend and _FAST_PATH and not indexed_attrs:
+            cls = _DirectedNetworkXBackend if directed else _UndirectedNetworkXBackend
+        return super().__new__(cls)
+
+    def __init__(self, directed: bool = False, indexed_attrs: Iterable[str] = ()):
         """
         Create a new Backend instance.
 
         Arguments:
             directed (bool: False): Whether to make the backend graph directed
+            indexed_attrs (Iterable[str]): Node attributes to keep an inverted
+                index of, for fast `get_nodes_by_attribute` queries. Only
+                changes made through the backend are indexed.
 
         Returns:
             None
 
         """
-        self._nx_graph = nx.DiGraph() if directed else nx.Graph()
+        self._nx_graph = _NXDiGraph() if directed else _NXGraph()
         self._directed = directed
+        self._attr_index = {attribute: {} for attribute in indexed_attrs}
 
     def is_directed(self) -> bool:
         """
@@ -47,34 +120,91 @@ class NetworkXBackend(Backend):
             Hashable: The ID of this node, as inserted
 
         """
-        self._nx_graph.add_node(node_name, **metadata)
+        if self._attr_index:
+            previous = dict(self._nx_graph._node.get(node_name, ()))
+            self._nx_graph.add_node(node_name, **metadata)
+            self._reindex_node(node_name, previous, metadata)
+        else:
+            self._nx_graph.add_node(node_name, **metadata)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        """
+        Add nodes to the graph.
+
+        This hands the whole batch to networkx in a single call, unless there
+        are attribute indexes to update.
+
+        Arguments:
+            nodes_for_adding: iterable of nodes or (node, metadata) tuples
+            attr: additional attributes to set on every node
 
-    def get_node_by_id(self, node_name: Hashable):
         """
-        Return the data associated with a node.
+        if not self._attr_index:
+            self._nx_graph.add_nodes_from(nodes_for_adding, **attr)
+            return
+        for n in nodes_for_adding:
+            # Like networkx, treat unhashable items as (node, metadata) pairs:
+            try:
+                hash(n)
+                node_name, metadata = n, {}
+            except TypeError:
+                node_name, metadata = n
+            self.add_node(node_name, {**attr, **metadata})
+
+    def _reindex_node(self, node_name: Hashable, previous: dict, metadata: dict):
+        """
+        Move a node between inverted-index entries after its metadata changed.
 
         Arguments:
-            node_name (Hashable): The node ID to look up
+            node_name (Hashable): The ID of the node
+            previous (dict): The node's metadata before the change
+            metadata (dict): The metadata that was just set on the node
+
+        """
+        for attribute, index in self._attr_index.items():
+            if attribute not in metadata:
+                continue
+            if attribute in previous:
+                nodes = index.get(previous[attribute])
+                if nodes is not None:
+                    nodes.discard(node_name)
+                    if not nodes:
+                        del index[previous[attribute]]
+            index.setdefault(metadata[attribute], set()).add(node_name)
+
+    def get_nodes_by_attribute(self, attribute: str, value: Any) -> set:
+        """
+        Get the IDs of all nodes whose `attribute` metadata equals `value`.
+
+        This is a dictionary lookup for attributes passed as `indexed_attrs`
+        when creating the backend, and a scan of all nodes otherwise.
+
+        Arguments:
+            attribute (str): The metadata key to match
+            value (Any): The value to match
 
         Returns:
-            dict: The metadata associated with this node
+            set: The IDs of the matching nodes
 
         """
-        return self._nx_graph.nodes[node_name]
+        if attribute in self._attr_index:
+            return set(self._attr_index[attribute].get(value, ()))
+        return super().get_nodes_by_attribute(attribute, value)
 
-    def all_nodes_as_iterable(self, include_metadata: bool = False) -> Collection:
+    def get_node_by_id(self, node_name: Hashable):
         """
-        Get a generator of all of the nodes in this graph.
+        Return the data associated with a node.
 
         Arguments:
-            include_metadata (bool: False): Whether to include node metadata in
-                the response
+            node_name (Hashable): The node ID to look up
 
         Returns:
-            Generator: A generator of all nodes (arbitrary sort)
+            dict: The metadata associated with this node
 
         """
-        return list(self._nx_graph.nodes(data=include_metadata))
+        return self._nx_graph.nodes[node_name]
+
+    all_nodes_as_iterable = _accel.all_nodes_as_iterable
 
     def add_edge(self, u: Hashable, v: Hashable, metadata: dict):
         """
@@ -94,18 +224,20 @@ class NetworkXBackend(Backend):
         """
         self._nx_graph.add_edge(u, v, **metadata)
 
-    def all_edges_as_iterable(self, include_metadata: bool = False) -> Collection:
+    def add_edges_from(self, ebunch_to_add, **attr):
         """
-        Get a list of all edges in this graph, arbitrary sort.
+        Add new edges to the graph.
 
-        Arguments:
-            include_metadata (bool: False): Whether to include edge metadata
+        This hands the whole batch to networkx in a single call.
 
-        Returns:
-            Generator: A generator of all edges (arbitrary sort)
+        Arguments:
+            ebunch_to_add: iterable of (source, target, metadata) tuples
+            attr: additional attributes to set on every edge
 
         """
-        return self._nx_graph.edges(data=include_metadata)
+        self._nx_graph.add_edges_from(ebunch_to_add, **attr)
+
+    all_edges_as_iterable = _accel.all_edges_as_iterable
 
     def get_edge_by_id(self, u: Hashable, v: Hashable):
         """
@@ -181,35 +313,101 @@ class NetworkXBackend(Backend):
         """
         return len(self._nx_graph.edges)
 
+    def freeze(self):
+        """
+        Get a read-only CSR snapshot of this graph, optimized for reads.
+
+        Arguments:
+            None
+
+        Returns:
+            FrozenBackend: A new, immutable backend
+
+        """
+        import numpy as np
+
+        from ._frozen import FrozenBackend
+
+        g = self._nx_graph
+        nodes = list(g._node)
+        iloc = {node: i for i, node in enumerate(nodes)}
+        rows = [g._adj[node] for node in nodes]
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter((len(nbrs) for nbrs in rows), dtype=np.int64, count=len(rows)),
+            out=indptr[1:],
+        )
+        indices = np.fromiter(
+            (iloc[v] for nbrs in rows for v in nbrs), dtype=np.int64, count=indptr[-1]
+        )
+        edge_metadata = [data for nbrs in rows for data in nbrs.values()]
+        return FrozenBackend(
+            self._directed,
+            nodes,
+            list(g._node.values()),
+            indptr,
+            indices,
+            edge_metadata,
+        )
+
     def ingest_from_edgelist_dataframe(
-        self, edgelist: pd.DataFrame, source_column: str, target_column: str
+        self, edgelist: "pd.DataFrame", source_column: str, target_column: str
     ) -> dict:
         """
         Ingest an edgelist from a Pandas DataFrame.
 
         """
 
+        import pandas as pd
+
         tic = time.time()
+        # Factorize both endpoint columns together, so that every occurrence
+        # of a node ID becomes the same object. Each ID is then hashed once,
+        # and networkx's dict lookups match on identity before equality.
+        codes, nodes = pd.factorize(
+            pd.concat(
+                [edgelist[source_column], edgelist[target_column]], ignore_index=True
+            ),
+            use_na_sentinel=False,
+        )
+        nodes = nodes.tolist()
+        endpoints = [nodes[code] for code in codes.tolist()]
+        metadata = edgelist.drop(columns=[source_column, target_column]).to_dict(
+            "records"
+        )
         self._nx_graph.add_edges_from(
-            [
-                (
-                    e[source_column],
-                    e[target_column],
-                    {
-                        k: v
-                        for k, v in dict(e).items()
-                        if k not in [source_column, target_column]
-                    },
-                )
-                for _, e in edgelist.iterrows()
-            ]
+            zip(endpoints[: len(edgelist)], endpoints[len(edgelist) :], metadata)
         )
 
-        nodes = edgelist[source_column].append(edgelist[target_column]).unique()
-
         return {
             "node_count": len(nodes),
             "node_duration": 0,
             "edge_count": len(edgelist),
             "edge_duration": time.time() - tic,
         }
+
+
+class _UndirectedNetworkXBackend(NetworkXBackend):
+    """
+    A NetworkXBackend for undirected graphs that writes straight into the
+    networkx graph's dicts, rather than calling its add_node / add_edge.
+
+    """
+
+    __slots__ = ()
+
+    add_node = _accel.undirected_add_node
+    add_edge = _accel.undirected_add_edge
+
+
+class _DirectedNetworkXBackend(NetworkXBackend):
+    """
+    A NetworkXBackend for directed graphs that writes straight into the
+    networkx graph's dicts, rather than calling its add_node / add_edge.
+
+    """
+
+    __slots__ = ()
+
+    add_node = _accel.directed_add_node
+    add_edge = _accel.directed_add_edge
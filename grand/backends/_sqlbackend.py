@@ -1,15 +1,35 @@
-from typing import Hashable, Generator
+from typing import Hashable, Generator, Iterable
+import itertools
+import json
 import time
 
+import numpy as np
 import pandas as pd
 import sqlalchemy
-from sqlalchemy.sql import delete, select
+from sqlalchemy.sql import bindparam, delete, exists, select
 from sqlalchemy import or_, func, Index
 
 from .backend import Backend
 
 _DEFAULT_SQL_URL = "sqlite:///"
 _DEFAULT_SQL_STR_LEN = 64
+# The most bound parameters one statement may use, by dialect (and for any
+# dialect not listed):
+_MAX_SQL_PARAMETERS = {"sqlite": 999, "mysql": 65535, "postgresql": 32767}
+_DEFAULT_MAX_SQL_PARAMETERS = 999
+
+# Connection pool settings for database servers, unless a poolclass is given.
+# SQLite keeps SQLAlchemy's own choice of pool:
+_DEFAULT_POOL_KWARGS = {"pool_pre_ping": True, "pool_size": 10, "max_overflow": 20}
+
+# Rows fetched at a time when streaming whole tables:
+_STREAM_YIELD_PER = 1000
+
+
+def _edge_pk(u: Hashable, v: Hashable) -> str:
+    # The primary key of the edge from u to v. Vectorized in
+    # SQLBackend.ingest_from_edgelist_dataframe, which must stay in step:
+    return "__" + str(u) + "__" + str(v)
 
 
 class SQLBackend(Backend):
@@ -40,6 +60,8 @@ class SQLBackend(Backend):
             db_url (str: _DEFAULT_SQL_URL): The URL to use for the SQL db.
             primary_key (str: "ID"): The default primary key to use for the
                 tables. Note that this key cannot exist in your metadata dicts.
+            sqlalchemy_kwargs (dict: None): Arguments for create_engine. On
+                database servers, a QueuePool is configured by default.
             edge_table_source_column (str: None): The name of the column to use
                 for the source node in the edge table.
             edge_table_target_column (str: None): The name of the column to use
@@ -54,7 +76,13 @@ class SQLBackend(Backend):
         self._edge_source_key = edge_table_source_column or "Source"
         self._edge_target_key = edge_table_target_column or "Target"
 
-        sqlalchemy_kwargs = sqlalchemy_kwargs or {}
+        sqlalchemy_kwargs = dict(sqlalchemy_kwargs or {})
+        if (
+            sqlalchemy.engine.make_url(db_url).get_backend_name() != "sqlite"
+            and "poolclass" not in sqlalchemy_kwargs
+        ):
+            for key, value in _DEFAULT_POOL_KWARGS.items():
+                sqlalchemy_kwargs.setdefault(key, value)
         self._engine = sqlalchemy.create_engine(db_url, **sqlalchemy_kwargs)
         self._connection = self._engine.connect()
         self._metadata = sqlalchemy.MetaData()
@@ -95,13 +123,43 @@ class SQLBackend(Backend):
         )
         self._edge_table.create(self._engine, checkfirst=True)
 
-        # Create source and target index
-        sindex = Index("edge_source", source_column)
+        # Create composite source/target indexes. Each also serves lookups on
+        # its first column alone, and covers both endpoint columns:
+        sindex = Index(
+            f"{self._edge_table_name}_source_target", source_column, target_column
+        )
         sindex.create(self._engine, checkfirst=True)
 
-        tindex = Index("edge_target", target_column)
+        tindex = Index(
+            f"{self._edge_table_name}_target_source", target_column, source_column
+        )
         tindex.create(self._engine, checkfirst=True)
 
+        # Columns, looked up once rather than in every query:
+        self._node_pk_col = self._node_table.c[self._primary_key]
+        self._node_meta_col = self._node_table.c["_metadata"]
+        self._edge_pk_col = self._edge_table.c[self._primary_key]
+        self._edge_src_col = self._edge_table.c[self._edge_source_key]
+        self._edge_tgt_col = self._edge_table.c[self._edge_target_key]
+        self._edge_meta_col = self._edge_table.c["_metadata"]
+
+        # Statements for the most frequent lookups are built once, with bound
+        # parameters, rather than on every call:
+        self._has_node_statement = select(
+            exists().where(self._node_pk_col == bindparam("u"))
+        )
+        self._get_node_statement = select(self._node_meta_col).where(
+            self._node_pk_col == bindparam("u")
+        )
+        self._get_edge_statement = select(self._edge_meta_col).where(
+            self._edge_pk_col == bindparam("uv")
+        )
+        self._get_undirected_edge_statement = select(self._edge_meta_col).where(
+            self._edge_pk_col.in_([bindparam("uv"), bindparam("vu")])
+        )
+        # Neighbor queries, by (outgoing, incoming, include_metadata):
+        self._neighbor_statements = {}
+
     def is_directed(self) -> bool:
         """
         Return True if the backend graph is directed.
@@ -138,13 +196,18 @@ class SQLBackend(Backend):
             Hashable: The ID of this node, as inserted
 
         """
-        if self.has_node(node_name):
+        statement = self._upsert_statement(
+            self._node_table,
+            [{self._primary_key: str(node_name), "_metadata": metadata}],
+            metadata,
+        )
+        if statement is not None:
+            self._connection.execute(statement)
+        elif self.has_node(node_name):
             existing_metadata = self.get_node_by_id(node_name)
             existing_metadata.update(metadata)
             self._connection.execute(
-                self._node_table.update().where(
-                    self._node_table.c[self._primary_key] == str(node_name)
-                ),
+                self._node_table.update().where(self._node_pk_col == str(node_name)),
                 parameters={"_metadata": existing_metadata},
             )
         else:
@@ -155,15 +218,101 @@ class SQLBackend(Backend):
         return node_name
 
     def add_nodes_from(self, nodes_for_adding, **attr):
-        nodes = [
+        nodes = (
             {
                 self._primary_key: node,
                 "_metadata": {**attr, **metadata},
             }
             for node, metadata in nodes_for_adding
-        ]
+        )
+
+        self._insert_rows(self._node_table, nodes)
+
+    def _insert_rows(self, table, rows: Iterable[dict]):
+        """
+        Insert rows in chunks that fit within the database's parameter limit.
+
+        Rows are consumed lazily, so only one chunk is held in memory at once.
+
+        Arguments:
+            table (sqlalchemy.Table): The table to insert into
+            rows (Iterable[dict]): The rows (dicts of column values)
 
-        self._connection.execute(self._node_table.insert(), nodes)
+        Returns:
+            None
+
+        """
+        max_parameters = self._max_parameters()
+        chunk_size = max(1, max_parameters // len(table.columns))
+        rows = iter(rows)
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            self._connection.execute(table.insert(), chunk)
+
+    def _upsert_statement(self, table, rows: list, metadata: dict = None):
+        """
+        Build an INSERT that handles rows whose primary key already exists.
+
+        Existing rows get `metadata` merged into their metadata, as with
+        dict.update, or are left alone if `metadata` is empty. This replaces
+        a read before every write with a single statement.
+
+        Arguments:
+            table (sqlalchemy.Table): The node or edge table
+            rows (list): The rows (dicts of column values) to insert
+            metadata (dict: None): The metadata to merge into existing rows.
+                Only allowed when inserting a single row.
+
+        Returns:
+            The statement, or None if this database has no supported upsert
+            (in which case the caller should read before writing).
+
+        """
+        dialect = self._engine.dialect.name
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        elif dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            return None
+
+        statement = insert(table).values(rows)
+        if not metadata:
+            return statement.on_conflict_do_nothing(
+                index_elements=[table.c[self._primary_key]]
+            )
+
+        existing = table.c["_metadata"]
+        if dialect == "sqlite":
+            # JSON paths cannot quote keys that contain a double quote:
+            if any('"' in str(key) for key in metadata):
+                return None
+            # Set each key in turn, so that values replace (rather than merge
+            # into) what is there, like dict.update:
+            merged = func.json_set(
+                func.coalesce(existing, "{}"),
+                *[
+                    argument
+                    for key, value in metadata.items()
+                    for argument in (f'$."{key}"', func.json(json.dumps(value)))
+                ],
+            )
+        else:
+            from sqlalchemy.dialects.postgresql import JSONB
+
+            # jsonb || jsonb replaces top-level keys, like dict.update:
+            merged = sqlalchemy.cast(
+                sqlalchemy.cast(existing, JSONB).op("||")(
+                    sqlalchemy.cast(statement.excluded["_metadata"], JSONB)
+                ),
+                sqlalchemy.JSON,
+            )
+        return statement.on_conflict_do_update(
+            index_elements=[table.c[self._primary_key]],
+            set_={"_metadata": merged},
+        )
 
     def _upsert_node(self, node_name: Hashable, metadata: dict) -> Hashable:
         """
@@ -180,9 +329,7 @@ class SQLBackend(Backend):
         node_exists = self.has_node(node_name)
         if node_exists:
             self._connection.execute(
-                self._node_table.update().where(
-                    self._node_table.c[self._primary_key] == str(node_name)
-                ),
+                self._node_table.update().where(self._node_pk_col == str(node_name)),
                 parameters={"_metadata": metadata},
             )
         else:
@@ -200,17 +347,12 @@ class SQLBackend(Backend):
         """
 
         # Remove nodes
-        statement = delete(self._node_table).where(
-            self._node_table.c[self._primary_key] == str(u)
-        )
+        statement = delete(self._node_table).where(self._node_pk_col == str(u))
         self._connection.execute(statement)
 
         # Remove edges for node
         statement = delete(self._edge_table).where(
-            or_(
-                self._edge_table.c[self._edge_source_key] == str(u),
-                self._edge_table.c[self._edge_target_key] == str(u)
-            )
+            or_(self._edge_src_col == str(u), self._edge_tgt_col == str(u))
         )
         self._connection.execute(statement)
 
@@ -229,15 +371,10 @@ class SQLBackend(Backend):
         if include_metadata:
             sql = self._node_table.select()
         else:
-            sql = self._node_table.select().with_only_columns(
-                self._node_table.c[self._primary_key]
-            )
-
-        results = []
-        for x in self._connection.execute(sql):
-            results.append(x if include_metadata else x[0])
+            sql = self._node_table.select().with_only_columns(self._node_pk_col)
 
-        return results
+        for x in self._stream(sql):
+            yield x if include_metadata else x[0]
 
     def has_node(self, u: Hashable) -> bool:
         """
@@ -249,13 +386,11 @@ class SQLBackend(Backend):
         Returns:
             bool: True if the node exists
         """
-        return len(
+        return bool(
             self._connection.execute(
-                self._node_table.select().where(
-                    self._node_table.c[self._primary_key] == str(u)
-                )
-            ).fetchall()
-        ) > 0
+                self._has_node_statement, parameters={"u": str(u)}
+            ).scalar()
+        )
 
     def add_edge(self, u: Hashable, v: Hashable, metadata: dict):
         """
@@ -273,12 +408,37 @@ class SQLBackend(Backend):
             Hashable: The edge ID, as inserted.
 
         """
-        pk = f"__{u}__{v}"
+        pk = _edge_pk(u, v)
+
+        # Create any missing endpoints, without touching existing ones:
+        nodes = [
+            {self._primary_key: str(node), "_metadata": {}}
+            for node in dict.fromkeys([u, v])
+        ]
+        statement = self._upsert_statement(self._node_table, nodes)
+        if statement is not None:
+            self._connection.execute(statement)
+        else:
+            if not self.has_node(u):
+                self.add_node(u, {})
+            if not self.has_node(v):
+                self.add_node(v, {})
 
-        if not self.has_node(u):
-            self.add_node(u, {})
-        if not self.has_node(v):
-            self.add_node(v, {})
+        statement = self._upsert_statement(
+            self._edge_table,
+            [
+                {
+                    self._primary_key: pk,
+                    self._edge_source_key: u,
+                    self._edge_target_key: v,
+                    "_metadata": metadata,
+                }
+            ],
+            metadata,
+        )
+        if statement is not None:
+            self._connection.execute(statement)
+            return pk
 
         try:
             self._connection.execute(
@@ -295,30 +455,28 @@ class SQLBackend(Backend):
             existing_metadata = self.get_edge_by_id(u, v)
             existing_metadata.update(metadata)
             self._connection.execute(
-                self._edge_table.update().where(
-                    self._edge_table.c[self._primary_key] == pk
-                ),
+                self._edge_table.update().where(self._edge_pk_col == pk),
                 parameters={"_metadata": existing_metadata},
             )
 
         return pk
 
     def add_edges_from(self, ebunch_to_add, **attr):
-        edges = [
+        edges = (
             {
-                self._primary_key: f"__{u}__{v}",
+                self._primary_key: _edge_pk(u, v),
                 self._edge_source_key: u,
                 self._edge_target_key: v,
                 "_metadata": {**attr, **metadata},
             }
             for u, v, metadata in ebunch_to_add
-        ]
+        )
 
-        self._connection.execute(self._edge_table.insert(), edges)
+        self._insert_rows(self._edge_table, edges)
 
     def all_edges_as_iterable(self, include_metadata: bool = False) -> Generator:
         """
-        Get a list of all edges in this graph, arbitrary sort.
+        Get a generator of all edges in this graph, arbitrary sort.
 
         Arguments:
             include_metadata (bool: False): Whether to include edge metadata
@@ -328,15 +486,22 @@ class SQLBackend(Backend):
         """
 
         columns = [
-            self._edge_table.c[self._edge_source_key],
-            self._edge_table.c[self._edge_target_key],
+            self._edge_src_col,
+            self._edge_tgt_col,
         ]
 
         if include_metadata:
-            columns.append(self._edge_table.c["_metadata"])
+            columns.append(self._edge_meta_col)
 
         sql = self._edge_table.select().with_only_columns(*columns)
-        return self._connection.execute(sql).fetchall()
+        yield from self._stream(sql)
+
+    def _stream(self, sql):
+        # Fetch rows in batches, with a server-side cursor where the driver
+        # supports one, rather than buffering the whole result:
+        return self._connection.execute(
+            sql, execution_options={"yield_per": _STREAM_YIELD_PER}
+        )
 
     def get_node_by_id(self, node_name: Hashable):
         """
@@ -351,13 +516,11 @@ class SQLBackend(Backend):
         """
 
         res = self._connection.execute(
-            self._node_table.select().where(
-                self._node_table.c[self._primary_key] == str(node_name)
-            )
+            self._get_node_statement, parameters={"u": str(node_name)}
         ).fetchone()
 
         if res:
-            return res._metadata
+            return res[0]
 
         raise KeyError(f"Node {node_name} not found")
 
@@ -374,27 +537,120 @@ class SQLBackend(Backend):
 
         """
         if self._directed:
-            pk = f"__{u}__{v}"
             result = self._connection.execute(
-                self._edge_table.select().where(
-                    self._edge_table.c[self._primary_key] == pk
-                )
+                self._get_edge_statement, parameters={"uv": _edge_pk(u, v)}
             ).fetchone()
-            if result:
-                return result._metadata
-            raise KeyError(f"Edge {u}-{v} not found.")
         else:
             result = self._connection.execute(
-                self._edge_table.select().where(
-                    or_(
-                        (self._edge_table.c[self._primary_key] == f"__{u}__{v}"),
-                        (self._edge_table.c[self._primary_key] == f"__{v}__{u}"),
-                    )
-                )
+                self._get_undirected_edge_statement,
+                parameters={"uv": _edge_pk(u, v), "vu": _edge_pk(v, u)},
             ).fetchone()
-            if result:
-                return result._metadata
-            raise KeyError(f"Edge {u}-{v} not found.")
+        if result:
+            return result[0]
+        raise KeyError(f"Edge {u}-{v} not found.")
+
+    def get_nodes_by_ids(self, node_names: Iterable[Hashable]) -> dict:
+        """
+        Get the metadata of many nodes at once.
+
+        Nodes are read with `IN` queries, as many per query as the parameter
+        limit allows, rather than with one query per node.
+
+        Arguments:
+            node_names (Iterable[Hashable]): The node IDs to look up
+
+        Returns:
+            dict: A mapping of node ID to metadata. Nodes that are not in
+                the graph are left out.
+
+        """
+        keys = {str(node): node for node in node_names}
+        return {
+            keys[key]: metadata
+            for key, metadata in self._metadata_by_key(self._node_table, keys)
+        }
+
+    def get_edges_by_ids(self, edges: Iterable[tuple]) -> dict:
+        """
+        Get the metadata of many edges at once.
+
+        Edges are read with `IN` queries, as many per query as the parameter
+        limit allows, rather than with one query per edge.
+
+        Arguments:
+            edges (Iterable[tuple]): The (source, target) pairs to look up
+
+        Returns:
+            dict: A mapping of (source, target) to metadata. Edges that are
+                not in the graph are left out.
+
+        """
+        keys = {}
+        for u, v in edges:
+            keys[_edge_pk(u, v)] = (u, v)
+            if not self._directed:
+                keys.setdefault(_edge_pk(v, u), (u, v))
+        return {
+            keys[key]: metadata
+            for key, metadata in self._metadata_by_key(self._edge_table, keys)
+        }
+
+    def _metadata_by_key(self, table, keys: Iterable[str]):
+        # Yield (primary key, metadata) for each of `keys` found in `table`:
+        primary_key = table.c[self._primary_key]
+        keys = iter(keys)
+        while True:
+            chunk = list(itertools.islice(keys, self._max_parameters()))
+            if not chunk:
+                break
+            yield from self._connection.execute(
+                select(primary_key, table.c["_metadata"]).where(primary_key.in_(chunk))
+            )
+
+    def _neighbor_query(self, outgoing: bool, incoming: bool, include_metadata: bool):
+        """
+        Get a query for the nodes joined to a node `u` by an edge.
+
+        Only the other endpoint of each edge (and the metadata, if requested)
+        is selected, picked with a CASE expression when edges in both
+        directions are included. The node ID is bound as the "u" parameter,
+        and each query is only built once.
+
+        Rows are sorted by neighbor ID. For edges in one direction, this is
+        the order of the (source, target) or (target, source) index, so the
+        database does not have to sort them.
+
+        Arguments:
+            outgoing (bool): Whether to include edges for which u is the source
+            incoming (bool): Whether to include edges for which u is the target
+            include_metadata (bool): Whether to also select edge metadata
+
+        Returns:
+            The query, which yields (neighbor,) or (neighbor, metadata) rows
+
+        """
+        key = (outgoing, incoming, include_metadata)
+        if key in self._neighbor_statements:
+            return self._neighbor_statements[key]
+
+        u = bindparam("u")
+        source = self._edge_src_col
+        target = self._edge_tgt_col
+        if outgoing and incoming:
+            neighbor = sqlalchemy.case((source == u, target), else_=source)
+            condition = or_(source == u, target == u)
+        elif outgoing:
+            neighbor, condition = target, source == u
+        else:
+            neighbor, condition = source, target == u
+
+        columns = [neighbor]
+        if include_metadata:
+            columns.append(self._edge_meta_col)
+        self._neighbor_statements[key] = (
+            select(*columns).where(condition).order_by(neighbor)
+        )
+        return self._neighbor_statements[key]
 
     def get_node_neighbors(
         self, u: Hashable, include_metadata: bool = False
@@ -410,46 +666,17 @@ class SQLBackend(Backend):
 
         """
 
-        if self._directed:
-            res = self._connection.execute(
-                self._edge_table.select()
-                .where(self._edge_table.c[self._edge_source_key] == str(u))
-                .order_by(self._edge_table.c[self._primary_key])
-            ).fetchall()
-        else:
-            res = self._connection.execute(
-                self._edge_table.select()
-                .where(
-                    or_(
-                        (self._edge_table.c[self._edge_source_key] == str(u)),
-                        (self._edge_table.c[self._edge_target_key] == str(u)),
-                    )
-                )
-                .order_by(self._edge_table.c[self._primary_key])
-            ).fetchall()
-
-        res = [x._asdict() for x in res]
-
-        if include_metadata:
-            return {
-                (
-                    r[self._edge_source_key]
-                    if r[self._edge_source_key] != str(u)
-                    else r[self._edge_target_key]
-                ): r["_metadata"]
-                for r in res
-            }
-
-        return iter(
-            [
-                (
-                    r[self._edge_source_key]
-                    if r[self._edge_source_key] != str(u)
-                    else r[self._edge_target_key]
-                )
-                for r in res
-            ]
+        rows = self._connection.execute(
+            self._neighbor_query(
+                outgoing=True,
+                incoming=not self._directed,
+                include_metadata=include_metadata,
+            ),
+            parameters={"u": str(u)},
         )
+        if include_metadata:
+            return {r[0]: r[1] for r in rows}
+        return iter([r[0] for r in rows])
 
     def get_node_predecessors(
         self, u: Hashable, include_metadata: bool = False
@@ -464,46 +691,17 @@ class SQLBackend(Backend):
             Generator
 
         """
-        if self._directed:
-            res = self._connection.execute(
-                self._edge_table.select()
-                .where(self._edge_table.c[self._edge_target_key] == str(u))
-                .order_by(self._edge_table.c[self._primary_key])
-            ).fetchall()
-        else:
-            res = self._connection.execute(
-                self._edge_table.select()
-                .where(
-                    or_(
-                        (self._edge_table.c[self._edge_target_key] == str(u)),
-                        (self._edge_table.c[self._edge_source_key] == str(u)),
-                    )
-                )
-                .order_by(self._edge_table.c[self._primary_key])
-            ).fetchall()
-
-        res = [x._asdict() for x in res]
-
-        if include_metadata:
-            return {
-                (
-                    r[self._edge_source_key]
-                    if r[self._edge_source_key] != str(u)
-                    else r[self._edge_target_key]
-                ): r["_metadata"]
-                for r in res
-            }
-
-        return iter(
-            [
-                (
-                    r[self._edge_source_key]
-                    if r[self._edge_source_key] != str(u)
-                    else r[self._edge_target_key]
-                )
-                for r in res
-            ]
+        rows = self._connection.execute(
+            self._neighbor_query(
+                outgoing=not self._directed,
+                incoming=True,
+                include_metadata=include_metadata,
+            ),
+            parameters={"u": str(u)},
         )
+        if include_metadata:
+            return {r[0]: r[1] for r in rows}
+        return iter([r[0] for r in rows])
 
     def get_node_count(self) -> int:
         """
@@ -535,49 +733,62 @@ class SQLBackend(Backend):
             select(func.count()).select_from(self._edge_table)
         ).scalar()
 
-    def out_degrees(self, nbunch=None):
+    def degrees(self, nbunch=None):
         """
-        Return the in-degree of each node in the graph.
+        Return the degree of each node in the graph.
+
+        All degrees are counted with one GROUP BY query, rather than a query
+        per node. As with `degree`, a directed graph counts outgoing edges.
 
         Arguments:
-            nbunch (Iterable): The nodes to get the in-degree of
+            nbunch (Iterable): The nodes to get the degree of (default: all)
 
         Returns:
-            dict: A dictionary of node: in-degree pairs
+            dict: A dictionary of node: degree pairs
 
         """
-
         if nbunch is None:
-            where_clause = None
-        elif isinstance(nbunch, (list, tuple)):
-            where_clause = self._edge_table.c[self._edge_source_key].in_(
-                [str(x) for x in nbunch]
-            )
+            nodes = list(self.all_nodes_as_iterable())
+        elif isinstance(nbunch, (str, bytes)) or not isinstance(nbunch, Iterable):
+            # A single node:
+            nodes = [nbunch]
         else:
-            # single node:
-            where_clause = self._edge_table.c[self._edge_source_key] == str(nbunch)
-
-        if self._directed:
-            query = (
-                select(self._edge_table.c[self._edge_source_key], func.count())
-                .select_from(self._edge_table)
-                .group_by(self._edge_table.c[self._edge_source_key])
-            )
-        else:
-            query = (
-                select(self._edge_table.c[self._edge_source_key], func.count())
-                .select_from(self._edge_table)
-                .group_by(self._edge_table.c[self._edge_source_key])
+            nodes = list(nbunch)
+
+        source = self._edge_src_col
+        target = self._edge_tgt_col
+        endpoints = select(source.label("node"))
+        if not self._directed:
+            # Also count each edge for its target, except self-loops, which
+            # have already been counted once:
+            endpoints = endpoints.union_all(
+                select(target.label("node")).where(target != source)
             )
+        endpoints = endpoints.subquery()
+        query = select(endpoints.c.node, func.count()).group_by(endpoints.c.node)
+
+        # Only filter when that fits within the parameter limit (otherwise it
+        # is cheaper to count every node anyway):
+        max_parameters = self._max_parameters()
+        if nbunch is not None and len(nodes) <= max_parameters:
+            query = query.where(endpoints.c.node.in_([str(node) for node in nodes]))
+
+        counts = {r[0]: r[1] for r in self._connection.execute(query)}
+        return {node: counts.get(str(node), 0) for node in nodes}
+
+    def out_degrees(self, nbunch=None):
+        """
+        Return the out-degree of each node in the graph.
 
-        if where_clause is not None:
-            query = query.where(where_clause)
+        Arguments:
+            nbunch (Iterable): The nodes to get the out-degree of
 
-        results = {r[0]: r[1] for r in self._connection.execute(query)}
+        Returns:
+            dict: A dictionary of node: out-degree pairs, or the out-degree
+                of a single node if one is passed instead of a list
 
-        if nbunch and not isinstance(nbunch, (list, tuple)):
-            return results.get(nbunch, 0)
-        return results
+        """
+        return self._directional_degrees(self._edge_src_col, nbunch)
 
     def in_degrees(self, nbunch=None):
         """
@@ -587,41 +798,32 @@ class SQLBackend(Backend):
             nbunch (Iterable): The nodes to get the in-degree of
 
         Returns:
-            dict: A dictionary of node: in-degree pairs
+            dict: A dictionary of node: in-degree pairs, or the in-degree of
+                a single node if one is passed instead of a list
 
         """
+        return self._directional_degrees(self._edge_tgt_col, nbunch)
 
-        if nbunch is None:
-            where_clause = None
-        elif isinstance(nbunch, (list, tuple)):
-            where_clause = self._edge_table.c[self._edge_target_key].in_(
-                [str(x) for x in nbunch]
-            )
-        else:
-            # single node:
-            where_clause = self._edge_table.c[self._edge_target_key] == str(nbunch)
-
-        if self._directed:
-            query = (
-                select(self._edge_table.c[self._edge_target_key], func.count())
-                .select_from(self._edge_table)
-                .group_by(self._edge_table.c[self._edge_target_key])
-            )
-        else:
-            query = (
-                select(self._edge_table.c[self._edge_target_key], func.count())
+    def _directional_degrees(self, column, nbunch):
+        # Count edges by one endpoint column. A single node only needs a
+        # COUNT(*) over its index range, with no GROUP BY:
+        if nbunch is not None and not isinstance(nbunch, (list, tuple)):
+            return self._connection.execute(
+                select(func.count())
                 .select_from(self._edge_table)
-                .group_by(self._edge_table.c[self._edge_target_key])
-            )
-
-        if where_clause is not None:
-            query = query.where(where_clause)
+                .where(column == str(nbunch))
+            ).scalar()
 
-        results = {r[0]: r[1] for r in self._connection.execute(query)}
+        query = select(column, func.count()).group_by(column)
+        if nbunch is None:
+            return {r[0]: r[1] for r in self._connection.execute(query)}
 
-        if nbunch and not isinstance(nbunch, (list, tuple)):
-            return results.get(nbunch, 0)
-        return results
+        # Only filter in SQL when that fits within the parameter limit:
+        nodes = {str(x) for x in nbunch}
+        max_parameters = self._max_parameters()
+        if len(nodes) <= max_parameters:
+            query = query.where(column.in_(nodes))
+        return {r[0]: r[1] for r in self._connection.execute(query) if r[0] in nodes}
 
     def ingest_from_edgelist_dataframe(
         self, edgelist: pd.DataFrame, source_column: str, target_column: str
@@ -640,52 +842,62 @@ class SQLBackend(Backend):
             }
         )
 
-        newlist[self._primary_key] = edgelist.apply(
-            lambda x: f"__{x[source_column]}__{x[target_column]}", axis="columns"
-        )
-        newlist["_metadata"] = edgelist.apply(
-            lambda x: {
-                k: v for k, v in x.items() if k not in [source_column, target_column]
-            },
-            axis="columns",
+        newlist[self._primary_key] = (
+            "__"
+            + edgelist[source_column].astype(str)
+            + "__"
+            + edgelist[target_column].astype(str)
         )
-
-        newlist[
-            [
-                self._edge_source_key,
-                self._edge_target_key,
-                self._primary_key,
-                "_metadata",
-            ]
-        ].to_sql(
-            self._edge_table_name,
-            self._engine,
-            index=False,
-            if_exists="append",
-            dtype={"_metadata": sqlalchemy.JSON},
+        newlist["_metadata"] = edgelist.drop(
+            columns=[source_column, target_column]
+        ).to_dict(orient="records")
+
+        edge_columns = [
+            self._edge_source_key,
+            self._edge_target_key,
+            self._primary_key,
+            "_metadata",
+        ]
+        nodes = pd.unique(
+            np.concatenate(
+                [
+                    edgelist[source_column].to_numpy(),
+                    edgelist[target_column].to_numpy(),
+                ]
+            )
         )
+        node_columns = [self._primary_key, "_metadata"]
+
+        # Commit both tables together:
+        with self._engine.begin() as connection:
+            newlist[edge_columns].to_sql(
+                self._edge_table_name,
+                connection,
+                index=False,
+                if_exists="append",
+                dtype={"_metadata": sqlalchemy.JSON},
+                **self._to_sql_kwargs(len(edge_columns)),
+            )
+            edge_toc = time.time() - edge_tic
 
-        edge_toc = time.time() - edge_tic
-
-        # now ingest nodes:
-        node_tic = time.time()
-        nodes = edgelist[source_column].append(edgelist[target_column]).unique()
-        pd.DataFrame(
-            [
+            # now ingest nodes, replacing any existing ones. The table is
+            # emptied rather than dropped, so that its primary key is kept:
+            node_tic = time.time()
+            connection.execute(delete(self._node_table))
+            pd.DataFrame(
                 {
-                    self._primary_key: node,
+                    self._primary_key: nodes,
                     # no metadata:
-                    "_metadata": {},
+                    "_metadata": [{} for _ in nodes],
                 }
-                for node in nodes
-            ]
-        ).to_sql(
-            self._node_table_name,
-            self._engine,
-            index=False,
-            if_exists="replace",
-            dtype={"_metadata": sqlalchemy.JSON},
-        )
+            ).to_sql(
+                self._node_table_name,
+                connection,
+                index=False,
+                if_exists="append",
+                dtype={"_metadata": sqlalchemy.JSON},
+                **self._to_sql_kwargs(len(node_columns)),
+            )
 
         return {
             "node_count": len(nodes),
@@ -694,6 +906,25 @@ class SQLBackend(Backend):
             "edge_duration": edge_toc,
         }
 
+    def _to_sql_kwargs(self, n_columns: int) -> dict:
+        # On database servers, write multi-row INSERTs with as many rows as
+        # the parameter limit allows, to save a round trip per row. SQLite is
+        # in-process, and its executemany is much faster than multi-row
+        # INSERTs, so keep pandas' default there:
+        dialect = self._engine.dialect.name
+        if dialect == "sqlite":
+            return {}
+        return {
+            "method": "multi",
+            "chunksize": max(1, self._max_parameters() // n_columns),
+        }
+
+    def _max_parameters(self) -> int:
+        # The most bound parameters one statement may use on this database:
+        return _MAX_SQL_PARAMETERS.get(
+            self._engine.dialect.name, _DEFAULT_MAX_SQL_PARAMETERS
+        )
+
     def commit(self):
         self._connection.commit()
 
@@ -1,8 +1,10 @@
 import cachetools.func
-from typing import Callable, Hashable, Collection
+import functools
+from typing import Any, Callable, Hashable, Collection, Iterable, TYPE_CHECKING
 import abc
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Backend(abc.ABC):
@@ -13,6 +15,8 @@ class Backend(abc.ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, directed: bool = False):
         """
         Create a new Backend instance.
@@ -27,7 +31,7 @@ class Backend(abc.ABC):
         ...
 
     def ingest_from_edgelist_dataframe(
-        self, edgelist: pd.DataFrame, source_column: str, target_column: str
+        self, edgelist: "pd.DataFrame", source_column: str, target_column: str
     ) -> None:
         """
         Ingest an edgelist from a Pandas DataFrame.
@@ -190,6 +194,46 @@ class Backend(abc.ABC):
         """
         ...
 
+    def get_nodes_by_ids(self, node_names: Iterable[Hashable]) -> dict:
+        """
+        Get the metadata of many nodes at once.
+
+        The default looks up each node in turn. Backends that can read many
+        nodes in one request should override this.
+
+        Arguments:
+            node_names (Iterable[Hashable]): The node IDs to look up
+
+        Returns:
+            dict: A mapping of node ID to metadata. Nodes that are not in
+                the graph are left out.
+
+        """
+        return {
+            node: self.get_node_by_id(node)
+            for node in node_names
+            if self.has_node(node)
+        }
+
+    def get_edges_by_ids(self, edges: Iterable[tuple]) -> dict:
+        """
+        Get the metadata of many edges at once.
+
+        The default looks up each edge in turn. Backends that can read many
+        edges in one request should override this.
+
+        Arguments:
+            edges (Iterable[tuple]): The (source, target) pairs to look up
+
+        Returns:
+            dict: A mapping of (source, target) to metadata. Edges that are
+                not in the graph are left out.
+
+        """
+        return {
+            (u, v): self.get_edge_by_id(u, v) for u, v in edges if self.has_edge(u, v)
+        }
+
     def get_node_successors(
         self, u: Hashable, include_metadata: bool = False
     ) -> Collection:
@@ -229,6 +273,9 @@ class Backend(abc.ABC):
         """
         Get an integer count of the number of nodes in this graph.
 
+        The default walks every node ID. Backends that can count in the
+        underlying store (e.g. with a SQL `COUNT(*)`) should override this.
+
         Arguments:
             None
 
@@ -236,7 +283,7 @@ class Backend(abc.ABC):
             int: The count of nodes
 
         """
-        return len([i for i in self.all_nodes_as_iterable()])
+        return sum(1 for _ in self.all_nodes_as_iterable())
 
     def get_edge_count(self) -> int:
         """
@@ -249,7 +296,7 @@ class Backend(abc.ABC):
             int: The count of edges
 
         """
-        return len([i for i in self.all_edges_as_iterable()])
+        return sum(1 for _ in self.all_edges_as_iterable())
 
     def degree(self, u: Hashable) -> int:
         """
@@ -262,9 +309,22 @@ class Backend(abc.ABC):
             int: The degree of the node
 
         """
-        return len([i for i in self.get_node_neighbors(u)])
+        return sum(1 for _ in self.get_node_neighbors(u))
 
     def degrees(self, nbunch=None) -> Collection:
+        """
+        Get the degree of many nodes at once.
+
+        The default calls `degree` once per node. Backends that can count
+        every degree in one pass should override this.
+
+        Arguments:
+            nbunch (Iterable: None): The node IDs, or None for every node
+
+        Returns:
+            dict: A mapping of node ID to degree
+
+        """
         return {
             node: self.degree(node) for node in (nbunch or self.all_nodes_as_iterable())
         }
@@ -283,7 +343,7 @@ class Backend(abc.ABC):
         return len(list(self.get_node_predecessors(u)))
 
     def in_degrees(self, nbunch=None) -> Collection:
-        nbunch = nbunch or self.all_nodes_as_iterable()
+        nbunch = nbunch or list(self.all_nodes_as_iterable())
         if isinstance(nbunch, (list, tuple)):
             return {node: self.in_degree(node) for node in nbunch}
         else:
@@ -303,12 +363,51 @@ class Backend(abc.ABC):
         return len(list(self.get_node_successors(u)))
 
     def out_degrees(self, nbunch=None) -> Collection:
-        nbunch = nbunch or self.all_nodes_as_iterable()
+        nbunch = nbunch or list(self.all_nodes_as_iterable())
         if isinstance(nbunch, (list, tuple)):
             return {node: self.out_degree(node) for node in nbunch}
         else:
             return self.out_degree(nbunch)
 
+    def get_nodes_by_attribute(self, attribute: str, value: Any) -> set:
+        """
+        Get the IDs of all nodes whose `attribute` metadata equals `value`.
+
+        By default this scans every node. Backends may override it to use an
+        index instead.
+
+        Arguments:
+            attribute (str): The metadata key to match
+            value (Any): The value to match
+
+        Returns:
+            set: The IDs of the matching nodes
+
+        """
+        return {
+            node
+            for node, metadata in self.all_nodes_as_iterable(include_metadata=True)
+            if attribute in metadata and metadata[attribute] == value
+        }
+
+    def freeze(self) -> "Backend":
+        """
+        Get a read-only snapshot of this graph, optimized for reads.
+
+        The snapshot stores adjacency as compressed sparse row (CSR) arrays,
+        and does not change when this backend is later modified.
+
+        Arguments:
+            None
+
+        Returns:
+            FrozenBackend: A new, immutable backend
+
+        """
+        from ._frozen import FrozenBackend
+
+        return FrozenBackend.from_backend(self)
+
 
 class CachedBackend(Backend):
     """
@@ -339,7 +438,10 @@ class InMemoryCachedBackend(CachedBackend):
         "add_edge",
         "add_edges_from",
         "ingest_from_edgelist_dataframe",
-        "remove_node"
+        "remove_node",
+        # These take lists of IDs, which cannot be cache keys:
+        "get_nodes_by_ids",
+        "get_edges_by_ids",
     ]
 
     _default_write_methods = [
@@ -351,6 +453,14 @@ class InMemoryCachedBackend(CachedBackend):
         "remove_node"
     ]
 
+    # Methods that may return single-use iterators (such as generators). Their
+    # results are materialized into tuples before they are cached, so that the
+    # cached value can be iterated more than once:
+    _materialized_methods = [
+        "all_nodes_as_iterable",
+        "all_edges_as_iterable",
+    ]
+
     def __init__(
         self,
         backend: Backend,
@@ -414,7 +524,15 @@ class InMemoryCachedBackend(CachedBackend):
                 )
 
     def _wrapped(self, method: str) -> Callable:
-        c = self._cache_factory()(getattr(self.backend, method))
+        backend_method = getattr(self.backend, method)
+        if method in self._materialized_methods:
+            iterable_method = backend_method
+
+            @functools.wraps(iterable_method)
+            def backend_method(*args, **kwargs):
+                return tuple(iterable_method(*args, **kwargs))
+
+        c = self._cache_factory()(backend_method)
         return c
 
     def clear_cache(self):
@@ -1,5 +1,8 @@
 import pytest
 import os
+import sys
+import warnings
+import numpy as np
 import pandas as pd
 
 import networkx as nx
@@ -134,6 +137,18 @@ if os.environ.get("TEST_IGRAPHBACKEND") == "1":
 
 
 # @pytest.mark.parametrize("backend", backend_test_params)
+def test_missing_optional_backends_are_absent(monkeypatch):
+    from .. import backends
+
+    # Make the SQL backend's import fail, as if SQLAlchemy were missing:
+    monkeypatch.delitem(vars(backends), "SQLBackend", raising=False)
+    monkeypatch.setitem(sys.modules, "grand.backends._sqlbackend", None)
+    assert not hasattr(backends, "SQLBackend")
+    assert getattr(backends, "SQLBackend", None) is None
+    with pytest.raises(AttributeError, match=r"pip install grand-graph\[sql\]"):
+        backends.SQLBackend
+
+
 class TestBackendPersistence:
     def test_sqlite_persistence(self):
         if not _CAN_IMPORT_SQL:
@@ -183,6 +198,16 @@ class TestBackend:
         b = backend(directed=False, **kwargs)
         assert b.is_directed() == False
 
+    def test_get_nodes_and_edges_by_ids(self, backend):
+        backend, kwargs = backend
+        b = backend(directed=True, **kwargs)
+        b.add_node("A", {"k": 1})
+        b.add_edge("A", "B", {"w": 2})
+        nodes = b.get_nodes_by_ids(["A", "B", "C"])
+        assert nodes == {"A": b.get_node_by_id("A"), "B": b.get_node_by_id("B")}
+        assert nodes["A"]["k"] == 1
+        assert b.get_edges_by_ids([("A", "B"), ("B", "C")]) == {("A", "B"): {"w": 2}}
+
     def test_can_add_node(self, backend):
         backend, kwargs = backend
         G = Graph(backend=backend(**kwargs))
@@ -482,3 +507,361 @@ class TestDataFrameBackend:
         b = DataFrameBackend(edge_df=edges, node_df=nodes)
         assert b.get_edge_count() == 5
         assert b.get_node_count() == 5
+
+    def test_adjacency_lookups(self):
+        edges = pd.DataFrame(
+            {"Source": ["A", "B", "C"], "Target": ["B", "C", "A"], "w": [1, 2, 3]}
+        )
+        for directed in (True, False):
+            b = DataFrameBackend(directed=directed)
+            b.ingest_from_edgelist_dataframe(edges.copy(), "Source", "Target")
+            b.add_edge("A", "D", {"w": 4})
+            assert b.has_edge("A", "D")
+            assert b.has_edge("D", "A") is not directed
+            assert b.get_edge_by_id("C", "A") == {"w": 3}
+            assert sorted(b.get_node_neighbors("A")) == (
+                ["B", "D"] if directed else ["B", "C", "D"]
+            )
+            assert sorted(b.get_node_predecessors("A")) == (
+                ["C"] if directed else ["B", "C", "D"]
+            )
+            assert b.get_node_neighbors("A", include_metadata=True)["D"] == {"w": 4}
+            b.add_edge("A", "D", {"w": 5})
+            assert b.get_edge_count() == 4
+            assert b.get_edge_by_id("A", "D") == {"w": 5}
+
+    def test_buffered_edges(self):
+        # A non-default index, whose labels must not collide with new rows:
+        edges = pd.DataFrame(
+            {"Source": ["A", "B"], "Target": ["B", "C"], "w": [1, 2]}, index=[2, 3]
+        )
+        b = DataFrameBackend(directed=True, edge_df=edges)
+        b.add_edge("C", "D", {"w": 3})
+        b.add_edge("D", "E", {})
+        b.add_edge("C", "D", {"w": 4})
+        assert b.has_edge("D", "E")
+        assert b.get_edge_count() == 4
+        assert list(b.all_edges_as_iterable()) == [
+            ("A", "B"),
+            ("B", "C"),
+            ("C", "D"),
+            ("D", "E"),
+        ]
+        assert b.get_edge_by_id("C", "D") == {"w": 4}
+        assert b.get_edge_by_id("A", "B") == {"w": 1}
+        assert b.get_edge_by_id("B", "C") == {"w": 2}
+        b.add_edge("A", "B", {"w": 5})
+        assert b.get_edge_by_id("A", "B") == {"w": 5}
+        b.add_edge("A", "B", {"label": "x"})
+        assert "label" in b.get_edge_by_id("B", "C")
+        # Repeated index labels, as from concatenating one-row frames:
+        edges = pd.concat(
+            [
+                pd.DataFrame({"Source": [1], "Target": [2], "w": [10]}),
+                pd.DataFrame({"Source": [3], "Target": [4], "w": [20]}),
+            ]
+        )
+        b = DataFrameBackend(directed=True, edge_df=edges)
+        b.add_edge(1, 2, {"w": 99})
+        assert b.get_edge_by_id(1, 2) == {"w": 99}
+        assert b.get_edge_by_id(3, 4) == {"w": 20}
+
+    def test_has_node_checks_values(self):
+        edges = pd.DataFrame({"Source": [10, 11], "Target": [11, 12]})
+        b = DataFrameBackend(edge_df=edges)
+        assert b.get_node_count() == 3
+        assert b.has_node(12)
+        assert b.has_nodes([12, 0, 10]).tolist() == [True, False, True]
+        # 0 is a row label of the edge table, but not a node:
+        assert not b.has_node(0)
+        assert list(b.all_nodes_as_iterable()) == [10, 11, 12]
+        b.add_node(13, {"x": 1})
+        assert b.has_node(10) and b.has_node(13)
+        assert sorted(b.all_nodes_as_iterable()) == [10, 11, 12, 13]
+        assert b.get_node_count() == 4
+
+    def test_ingest_downcasts(self):
+        edges = pd.DataFrame(
+            {"s": ["A", "B", "C"], "t": ["B", "C", "A"], "w": [1, 2, 300]}
+        )
+        b = DataFrameBackend(directed=True)
+        b.ingest_from_edgelist_dataframe(edges, "s", "t")
+        assert b._edge_df["w"].dtype == np.int64
+        assert b._edge_df["s"].dtype == "category"
+        assert list(b.get_node_neighbors("A")) == ["B"]
+        assert b.get_edge_by_id("C", "A") == {"w": 300}
+        b.add_edge("A", "D", {"w": 4})
+        assert sorted(b.get_node_neighbors("A", include_metadata=True)) == ["B", "D"]
+
+    def test_ingest_downcast_keeps_metadata_types(self):
+        edges = pd.DataFrame({"s": [1, 2], "t": [2, 3], "w": [1, 2]})
+        b = DataFrameBackend(directed=True)
+        b.ingest_from_edgelist_dataframe(edges, "s", "t")
+        assert b._edge_df["s"].dtype == np.int8
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            b.add_edge(1, 2, {"w": 100000})
+        assert b.get_edge_by_id(1, 2) == {"w": 100000}
+        # The caller's DataFrame is left alone:
+        assert edges["w"].tolist() == [1, 2]
+        assert edges["s"].dtype == np.int64
+
+    def test_endpoint_arrays_are_contiguous(self):
+        # All columns of a DataFrame built from one 2-D array share a block:
+        edges = pd.DataFrame(
+            np.array([[0, 1, 5], [1, 2, 6]]), columns=["Source", "Target", "w"]
+        )
+        b = DataFrameBackend(directed=True, edge_df=edges)
+        assert all(a.flags["C_CONTIGUOUS"] for a in b._endpoints())
+        assert b.get_node_neighbors(1, include_metadata=True) == {2: {"w": 6}}
+        neighbors = b.get_node_neighbors_array(0)
+        assert isinstance(neighbors, np.ndarray) and neighbors.tolist() == [1]
+
+    def test_node_attributes(self):
+        b = DataFrameBackend()
+        b.add_node("A", {"x": 1})
+        b.add_node("B", {"y": "b"})
+        b.add_node("A", {"y": "a"})
+        b.add_edge("B", "C", {})
+        assert b.get_node_by_id("A") == {"x": 1, "y": "a"}
+        assert b.get_node_by_id("B") == {"y": "b"}
+        assert b.get_node_by_id("C") == {}
+        assert b.get_node_count() == 3
+        df = b.node_df
+        assert df.index.tolist() == ["A", "B", "C"]
+        assert df.loc["A", "y"] == "a" and np.isnan(df.loc["B", "x"])
+        # Nodes known only from an existing edge table have no metadata:
+        b = DataFrameBackend(edge_df=pd.DataFrame({"Source": ["B"], "Target": ["C"]}))
+        assert b.get_node_by_id("C") == {}
+        b.add_node("A", {"x": 1})
+        assert b.has_node("C") and b.get_node_count() == 3
+        assert b.get_node_by_id("C") == {}
+        with pytest.raises(KeyError):
+            b.get_node_by_id("D")
+
+    def test_batch_lookups(self):
+        nodes = pd.DataFrame({"x": [1, 2]}, index=["A", "B"])
+        b = DataFrameBackend(directed=True, node_df=nodes)
+        b.add_edge("A", "B", {"w": 3})
+        b.add_edge("B", "A", {"w": 4})
+        nodes = b.get_node_columns(["B", "A"])
+        assert nodes["x"].tolist() == [2, 1]
+        edges = b.get_edge_columns([("B", "A"), ("A", "C"), ("A", "B")])
+        assert list(edges) == ["w"]
+        assert edges["w"][0] == 4 and edges["w"][2] == 3
+        assert np.isnan(edges["w"][1])
+
+
+class TestNetworkXBackend:
+    def test_all_edges_matches_networkx(self):
+        for directed in (True, False):
+            b = NetworkXBackend(directed=directed)
+            b.add_edge("A", "B", {"w": 1})
+            b.add_edge("B", "C", {"w": 2})
+            b.add_edge("C", "C", {})
+            assert list(b.all_edges_as_iterable()) == list(b._nx_graph.edges())
+            assert list(b.all_edges_as_iterable(include_metadata=True)) == list(
+                b._nx_graph.edges(data=True)
+            )
+
+    def test_all_nodes_matches_networkx(self):
+        b = NetworkXBackend()
+        b.add_node("A", {"k": "v"})
+        b.add_edge("A", "B", {})
+        assert list(b.all_nodes_as_iterable()) == ["A", "B"]
+        assert list(b.all_nodes_as_iterable(include_metadata=True)) == [
+            ("A", {"k": "v"}),
+            ("B", {}),
+        ]
+        assert b.degrees() == {"A": 1, "B": 1}
+
+    def test_fast_path_matches_networkx(self):
+        for directed in (True, False):
+            b = NetworkXBackend(directed=directed)
+            H = nx.DiGraph() if directed else nx.Graph()
+            for backend_call, nx_call in [
+                (lambda: b.add_node("A", {"k": 1}), lambda: H.add_node("A", k=1)),
+                (lambda: b.add_node("A", {"j": 2}), lambda: H.add_node("A", j=2)),
+                (lambda: b.add_edge("A", "B", {"w": 1}), lambda: H.add_edge("A", "B", w=1)),
+                (lambda: b.add_edge("A", "B", {"x": 2}), lambda: H.add_edge("A", "B", x=2)),
+                (lambda: b.add_edge("C", "C", {}), lambda: H.add_edge("C", "C")),
+            ]:
+                backend_call()
+                nx_call()
+                assert nx.utils.graphs_equal(b._nx_graph, H)
+                if directed:
+                    assert b._nx_graph._pred == H._pred
+            with pytest.raises(ValueError):
+                b.add_node(None, {})
+
+    def test_add_from_merges_common_attributes(self):
+        b = NetworkXBackend(directed=True)
+        b.add_nodes_from([("A", {"k": 1}), ("B", {})], k=0, j=2)
+        b.add_edges_from([("A", "B", {"w": 1}), ("B", "C", {})], w=0)
+        assert b.get_node_by_id("A") == {"k": 1, "j": 2}
+        assert b.get_node_by_id("B") == {"k": 0, "j": 2}
+        assert b.get_edge_by_id("A", "B") == {"w": 1}
+        assert b.get_edge_by_id("B", "C") == {"w": 0}
+
+    def test_specialized_backends(self):
+        import pickle
+
+        for directed in (True, False):
+            b = NetworkXBackend(directed=directed)
+            assert isinstance(b, NetworkXBackend)
+            assert b.is_directed() == directed
+            b.add_edge("A", "B", {"w": 1})
+            b2 = pickle.loads(pickle.dumps(b))
+            assert type(b2) is type(b)
+            assert b2.get_edge_by_id("A", "B") == {"w": 1}
+
+    def test_ingest_from_edgelist_dataframe(self):
+        b = NetworkXBackend(directed=True)
+        edgelist = pd.DataFrame(
+            {"s": ["A", "B", "A"], "t": ["B", "C", "C"], "w": [1, 2, 3]}
+        )
+        stats = b.ingest_from_edgelist_dataframe(edgelist, "s", "t")
+        assert stats["node_count"] == 3
+        assert stats["edge_count"] == 3
+        assert b.get_edge_by_id("B", "C") == {"w": 2}
+        assert sorted(b.all_edges_as_iterable()) == [("A", "B"), ("A", "C"), ("B", "C")]
+
+    def test_get_nodes_by_attribute(self):
+        for indexed_attrs in ((), ("color",)):
+            b = NetworkXBackend(directed=True, indexed_attrs=indexed_attrs)
+            b.add_node("A", {"color": "red"})
+            b.add_nodes_from([("B", {"color": "blue"}), "C"], color="red")
+            b.add_edge("A", "D", {"color": "green"})
+            assert b.get_nodes_by_attribute("color", "red") == {"A", "C"}
+            assert b.get_nodes_by_attribute("color", "green") == set()
+            b.add_node("A", {"color": "blue"})
+            assert b.get_nodes_by_attribute("color", "red") == {"C"}
+            assert b.get_nodes_by_attribute("color", "blue") == {"A", "B"}
+            assert b.get_nodes_by_attribute("size", 1) == set()
+
+
+@pytest.mark.skipif(not _CAN_IMPORT_IGRAPH, reason="igraph is not installed")
+class TestIGraphBackend:
+    def test_ingest_from_edgelist_dataframe(self):
+        b = IGraphBackend(directed=True)
+        b.add_node("A", {"k": 1})
+        edgelist = pd.DataFrame(
+            {"s": ["A", "B", "A"], "t": ["B", "C", "C"], "w": [1, 2, 3]}
+        )
+        stats = b.ingest_from_edgelist_dataframe(edgelist, "s", "t")
+        assert stats["node_count"] == 3
+        assert stats["edge_count"] == 3
+        assert b.get_node_count() == 3
+        assert b.get_node_by_id("A") == {"k": 1}
+        assert b.get_edge_by_id("B", "C") == {"w": 2}
+        assert sorted(b.all_edges_as_iterable()) == [("A", "B"), ("A", "C"), ("B", "C")]
+
+    def test_ingest_updates_existing_edges(self):
+        for directed in (True, False):
+            b = IGraphBackend(directed=directed)
+            b.add_edge("a", "b", {"w": 0})
+            edgelist = pd.DataFrame(
+                {"s": ["a", "c", "b"], "t": ["b", "a", "c"], "w": [1, 2, 3]}
+            )
+            b.ingest_from_edgelist_dataframe(edgelist, "s", "t")
+            edgelist = pd.DataFrame({"s": ["a", "a"], "t": ["c", "c"], "w": [4, 5]})
+            b.ingest_from_edgelist_dataframe(edgelist, "s", "t")
+            assert b.get_edge_by_id("a", "b") == {"w": 1}
+            assert b.get_node_successors("a", True)["b"] == {"w": 1}
+            if directed:
+                assert b.get_edge_count() == 4
+                assert b.get_edge_by_id("c", "a") == {"w": 2}
+                assert b.get_edge_by_id("a", "c") == {"w": 5}
+            else:
+                assert b.get_edge_count() == 3
+                assert b.get_edge_by_id("a", "c") == {"w": 5}
+
+
+@pytest.mark.skipif(
+    not _CAN_IMPORT_DYNAMODB or os.environ.get("TEST_DYNAMODB", default="1") != "1",
+    reason="DynamoDB Backend skipped because $TEST_DYNAMODB != 0 or boto3 is not installed",
+)
+class TestDynamoDBBackend:
+    def test_counts_after_writes(self):
+        b = DynamoDBBackend(
+            directed=True,
+            node_table_name="grand_CountTestNodes",
+            edge_table_name="grand_CountTestEdges",
+        )
+        try:
+            assert b.get_node_count() == 0
+            assert b.get_edge_count() == 0
+            b.add_node("A", {})
+            b.add_edge("A", "B", {})
+            # The cached counts are dropped by the writes:
+            assert b._node_table_name not in b._item_counts
+            assert b._edge_table_name not in b._item_counts
+            assert b.get_node_count() == 2
+            assert b.get_edge_count() == 1
+        finally:
+            b.teardown(yes_i_am_sure=True)
+
+
+@pytest.mark.skipif(not _CAN_IMPORT_SQL, reason="SQLAlchemy is not installed")
+class TestSQLBackend:
+    def test_upserts_merge_metadata(self):
+        b = SQLBackend(directed=True)
+        b.add_node("A", {"x": {"a": 1}, "y": 1, "z": [1, 2]})
+        b.add_node("A", {"x": {"b": 2}, "y": None})
+        assert b.get_node_by_id("A") == {"x": {"b": 2}, "y": None, "z": [1, 2]}
+        b.add_edge("A", "B", {"w": 1})
+        b.add_edge("A", "B", {"k": "v"})
+        assert b.get_edge_by_id("A", "B") == {"w": 1, "k": "v"}
+        # Adding an edge leaves existing endpoints' metadata alone:
+        assert b.get_node_by_id("A")["z"] == [1, 2]
+        assert b.get_node_by_id("B") == {}
+        assert b.get_node_count() == 2
+
+    def test_degrees_match_degree(self):
+        for directed in (True, False):
+            b = SQLBackend(directed=directed)
+            for u, v in [("A", "B"), ("A", "C"), ("C", "C"), ("D", "A")]:
+                b.add_edge(u, v, {})
+            b.add_node("E", {})
+            expected = {node: b.degree(node) for node in b.all_nodes_as_iterable()}
+            assert b.degrees() == expected
+            assert b.degrees(["A", "E"]) == {"A": expected["A"], "E": 0}
+            assert b.degrees({"A", "E"}) == {"A": expected["A"], "E": 0}
+            assert b.degrees(n for n in "AE") == {"A": expected["A"], "E": 0}
+            assert b.degrees("A") == {"A": expected["A"]}
+
+    def test_get_nodes_and_edges_by_ids(self):
+        for directed in (True, False):
+            b = SQLBackend(directed=directed)
+            b.add_node(1, {"k": 1})
+            b.add_edge(1, 2, {"w": 2})
+            assert b.get_nodes_by_ids([1, 2, 3]) == {1: {"k": 1}, 2: {}}
+            expected = {} if directed else {(2, 1): {"w": 2}}
+            assert b.get_edges_by_ids([(2, 1), (1, 3)]) == expected
+            assert b.get_edges_by_ids([(1, 2)]) == {(1, 2): {"w": 2}}
+
+    def test_directional_degrees_of_one_node(self):
+        b = SQLBackend(directed=True)
+        for u, v in [(0, 1), (0, 2), (1, 2)]:
+            b.add_edge(u, v, {})
+        assert b.out_degrees(0) == 2
+        assert b.in_degrees(2) == 2
+        assert b.in_degrees(0) == 0
+        assert b.out_degrees([0, 1]) == {"0": 2, "1": 1}
+
+    def test_ingest_from_edgelist_dataframe(self):
+        b = SQLBackend(directed=True)
+        edgelist = pd.DataFrame(
+            {"s": ["A", "B", "A"], "t": ["B", "C", "C"], "w": [1, 2, 3]},
+            index=[10, 20, 30],
+        )
+        stats = b.ingest_from_edgelist_dataframe(edgelist, "s", "t")
+        assert stats["node_count"] == 3
+        assert stats["edge_count"] == 3
+        assert b.get_edge_by_id("B", "C") == {"w": 2}
+        assert sorted(b.all_nodes_as_iterable()) == ["A", "B", "C"]
+        # The node table keeps its primary key, so upserts still work:
+        b.add_node("A", {"k": 1})
+        b.add_node("A", {"j": 2})
+        assert b.get_node_by_id("A") == {"k": 1, "j": 2}
+        assert b.get_node_count() == 3
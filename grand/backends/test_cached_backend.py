@@ -81,3 +81,16 @@ def test_cache_info():
 
     assert cached.cache_info()["get_node_count"].misses == 1
     assert cached.cache_info()["get_node_count"].hits == 1
+
+
+def test_cached_iterables_can_be_reused():
+    cached = InMemoryCachedBackend(NetworkXBackend(), maxsize=1024, ttl=20)
+    cached.add_edge("a", "b", {})
+    assert list(cached.all_nodes_as_iterable()) == ["a", "b"]
+    assert list(cached.all_nodes_as_iterable()) == ["a", "b"]
+    assert list(cached.all_edges_as_iterable()) == [("a", "b")]
+    assert list(cached.all_edges_as_iterable()) == [("a", "b")]
+    assert cached.cache_info()["all_edges_as_iterable"].hits == 1
+
+    cached.add_edge("b", "c", {})
+    assert list(cached.all_edges_as_iterable()) == [("a", "b"), ("b", "c")]
@@ -0,0 +1,97 @@
+import pytest
+
+from ._dataframe import DataFrameBackend
+from ._frozen import FrozenBackend
+from ._networkx import NetworkXBackend
+
+try:
+    from ._sqlbackend import SQLBackend
+
+    _CAN_IMPORT_SQL = True
+except ImportError:
+    _CAN_IMPORT_SQL = False
+
+
+def _build(backend):
+    backend.add_node("a", {"color": "red"})
+    backend.add_edge("a", "b", {"weight": 1})
+    backend.add_edge("b", "c", {"weight": 2})
+    backend.add_edge("c", "a", {"weight": 3})
+    backend.add_edge("c", "c", {"weight": 4})
+    return backend
+
+
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize(
+    "backend_type",
+    [
+        NetworkXBackend,
+        pytest.param(
+            SQLBackend if _CAN_IMPORT_SQL else None,
+            marks=pytest.mark.skipif(
+                not _CAN_IMPORT_SQL, reason="SQLAlchemy is not installed"
+            ),
+            id="SQLBackend",
+        ),
+        DataFrameBackend,
+    ],
+)
+def test_freeze_matches_source(backend_type, directed):
+    source = _build(backend_type(directed=directed))
+    frozen = source.freeze()
+    assert isinstance(frozen, FrozenBackend)
+    assert frozen.is_directed() == directed
+    assert frozen.get_node_count() == source.get_node_count()
+    assert frozen.get_edge_count() == source.get_edge_count()
+    assert sorted(frozen.all_nodes_as_iterable()) == sorted(
+        source.all_nodes_as_iterable()
+    )
+    assert frozen.get_node_by_id("a") == {"color": "red"}
+    assert len(list(frozen.all_edges_as_iterable())) == source.get_edge_count()
+    for u, v, metadata in frozen.all_edges_as_iterable(include_metadata=True):
+        assert source.has_edge(u, v)
+        assert frozen.get_edge_by_id(u, v) == metadata
+    assert sorted(frozen.get_node_neighbors("c")) == sorted(
+        source.get_node_neighbors("c")
+    )
+    assert sorted(frozen.get_node_predecessors("a")) == sorted(
+        source.get_node_predecessors("a")
+        if directed
+        else source.get_node_neighbors("a")
+    )
+    assert frozen.get_node_predecessors("a", include_metadata=True)["c"] == {
+        "weight": 3
+    }
+
+
+def test_frozen_edges():
+    frozen = _build(NetworkXBackend(directed=True)).freeze()
+    assert frozen.has_edge("a", "b")
+    assert not frozen.has_edge("b", "a")
+    assert frozen.has_edge("c", "c")
+    with pytest.raises(KeyError):
+        frozen.get_edge_by_id("b", "a")
+    assert frozen.degrees() == {"a": 1, "b": 1, "c": 2}
+
+
+def test_frozen_is_a_snapshot():
+    source = _build(NetworkXBackend())
+    frozen = source.freeze()
+    source.add_edge("a", "d", {})
+    assert not frozen.has_node("d")
+    assert frozen.freeze() is frozen
+    with pytest.raises(NotImplementedError):
+        frozen.add_node("d", {})
+    with pytest.raises(NotImplementedError):
+        frozen.add_edge("a", "d", {})
+
+
+def test_frozen_arrays_are_read_only():
+    frozen = _build(NetworkXBackend(directed=True)).freeze()
+    assert frozen.indptr.tolist() == [0, 1, 2, 4]
+    assert not frozen.indptr.flags.writeable
+    assert not frozen.indices.flags.writeable
+    assert frozen.nodes == ("a", "b", "c")
+    assert frozen.node_index["c"] == 2
+    with pytest.raises(TypeError):
+        frozen.node_index["d"] = 3
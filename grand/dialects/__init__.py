@@ -4,36 +4,25 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .. import Graph
 
-import pandas as pd
-
 import networkx as nx
-from networkx.classes.reportviews import NodeView
 from networkx.classes.coreviews import AdjacencyView, AtlasView
 
 
 class _GrandAdjacencyView(AdjacencyView):
 
-    __slots__ = ("_parent", "_pred_or_succ")  # Still uses AtlasView slots names _atlas
+    __slots__ = ("_parent", "_get_neighbors")  # Still uses AtlasView slots names _atlas
 
     def __init__(self, parent_nx_dialect: "NetworkXDialect", pred_or_succ: str):
         self._parent = parent_nx_dialect.parent
-        self._pred_or_succ = pred_or_succ
+        # Pick the backend lookup once here, rather than on every __getitem__:
+        self._get_neighbors = (
+            self._parent.backend.get_node_predecessors
+            if pred_or_succ == "pred"
+            else self._parent.backend.get_node_successors
+        )
 
     def __getitem__(self, name):
-        if self._pred_or_succ == "pred":
-            return {
-                neighbor: metadata
-                for neighbor, metadata in self._parent.backend.get_node_predecessors(
-                    name, include_metadata=True
-                ).items()
-            }
-        elif self._pred_or_succ == "succ":
-            return {
-                neighbor: metadata
-                for neighbor, metadata in self._parent.backend.get_node_successors(
-                    name, include_metadata=True
-                ).items()
-            }
+        return dict(self._get_neighbors(name, include_metadata=True))
 
     def __len__(self):
         return self._parent.backend.get_node_count()
@@ -52,6 +41,9 @@ class _GrandAdjacencyView(AdjacencyView):
 
 
 class _GrandNodeAtlasView(AtlasView):
+
+    __slots__ = ("parent",)
+
     def __init__(self, parent):
         self.parent = parent.parent
 
@@ -97,19 +89,60 @@ class NetworkXDialect(nx.Graph):
 
         """
         self.parent = parent
+        # The views are stateless wrappers around the backend, so build them
+        # once here rather than on every property access:
+        self._node_view = _GrandNodeAtlasView(self)
+        self._succ_view = _GrandAdjacencyView(self, "succ")
+        self._pred_view = _GrandAdjacencyView(self, "pred")
+        # Bind the backend's write methods once, to save a lookup per insert:
+        self._backend_add_node = parent.backend.add_node
+        self._backend_add_edge = parent.backend.add_edge
 
     def add_node(self, name: Hashable, **kwargs):
-        return self.parent.backend.add_node(name, kwargs)
+        return self._backend_add_node(name, kwargs)
+
+    def add_node_fast(self, name: Hashable, metadata: dict = None):
+        """
+        Add a node, taking its metadata as a dict rather than as kwargs.
+
+        This skips building a kwargs dict on every call, so prefer it over
+        `add_node` in bulk ingestion loops.
+
+        Arguments:
+            name (Hashable): The ID of the node
+            metadata (dict: None): The node's metadata
+
+        """
+        return self._backend_add_node(name, metadata if metadata is not None else {})
 
     def add_nodes_from(self, nodes_for_adding, **attr):
         return self.parent.backend.add_nodes_from(nodes_for_adding, **attr)
 
     def add_edge(self, u: Hashable, v: Hashable, **kwargs):
-        return self.parent.backend.add_edge(u, v, kwargs)
+        return self._backend_add_edge(u, v, kwargs)
+
+    def add_edge_fast(self, u: Hashable, v: Hashable, metadata: dict = None):
+        """
+        Add an edge, taking its metadata as a dict rather than as kwargs.
+
+        This skips building a kwargs dict on every call, so prefer it over
+        `add_edge` in bulk ingestion loops.
+
+        Arguments:
+            u (Hashable): The source node ID
+            v (Hashable): The target node ID
+            metadata (dict: None): The edge's metadata
+
+        """
+        return self._backend_add_edge(u, v, metadata if metadata is not None else {})
 
     def add_edges_from(self, ebunch_to_add, **attr):
         return self.parent.backend.add_edges_from(ebunch_to_add, **attr)
 
+    def __getitem__(self, u: Hashable) -> dict:
+        # Same as nx.Graph.__getitem__, but without building an adjacency view:
+        return dict(self.parent.backend.get_node_successors(u, include_metadata=True))
+
     def remove_node(self, name: Hashable):
         if hasattr(self.parent.backend, "remove_node"):
             return self.parent.backend.remove_node(name)
@@ -129,43 +162,43 @@ class NetworkXDialect(nx.Graph):
 
     @property
     def _node(self):
-        return _GrandNodeAtlasView(self)
+        return self._node_view
 
     @property
     def adj(self):
         """
         https://github.com/networkx/networkx/blob/master/networkx/classes/digraph.py#L323
         """
-        return _GrandAdjacencyView(self, "succ")
+        return self._succ_view
 
     @property
     def _adj(self):
         """
         https://github.com/networkx/networkx/blob/master/networkx/classes/digraph.py#L323
         """
-        return _GrandAdjacencyView(self, "succ")
+        return self._succ_view
 
     @property
     def succ(self):
-        return _GrandAdjacencyView(self, "succ")
+        return self._succ_view
 
     @property
     def _succ(self):
-        return _GrandAdjacencyView(self, "succ")
+        return self._succ_view
 
     @property
     def pred(self):
         """
         https://github.com/networkx/networkx/blob/master/networkx/classes/digraph.py#L323
         """
-        return _GrandAdjacencyView(self, "pred")
+        return self._pred_view
 
     @property
     def _pred(self):
         """
         https://github.com/networkx/networkx/blob/master/networkx/classes/digraph.py#L323
         """
-        return _GrandAdjacencyView(self, "pred")
+        return self._pred_view
 
     @property
     def graph(self):
@@ -247,6 +280,8 @@ class NetworkitDialect:
 
     """
 
+    __slots__ = ("parent",)
+
     def __init__(self, parent: "Graph") -> None:
         self.parent = parent
 
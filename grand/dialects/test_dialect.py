@@ -54,6 +54,34 @@ class TestNetworkXDialect(unittest.TestCase):
         H.add_edge("1", "3")
         self.assertEqual(G.nx.pred, H.pred)
 
+    def test_nx_getitem(self):
+        G = Graph(directed=True)
+        G.nx.add_edge("1", "2", weight=3)
+        dialect = NetworkXDialect(G)
+        self.assertEqual(dialect["1"], {"2": {"weight": 3}})
+        self.assertEqual(dialect["2"], {})
+        self.assertEqual(dialect.pred["2"], {"1": {"weight": 3}})
+        self.assertEqual(dialect["1"]["2"], G.nx["1"]["2"])
+
+    def test_nx_views_are_reused(self):
+        dialect = NetworkXDialect(Graph(directed=True))
+        self.assertIs(dialect.adj, dialect.succ)
+        self.assertIs(dialect.pred, dialect._pred)
+        self.assertIs(dialect._node, dialect._node)
+        dialect.add_edge("1", "2")
+        self.assertEqual(dialect.pred["2"], {"1": {}})
+
+    def test_nx_fast_adds(self):
+        for G in (Graph(directed=True), Graph()):
+            for nx_graph in (G.nx, NetworkXDialect(G)):
+                nx_graph.add_node_fast("1", {"color": "red"})
+                nx_graph.add_node_fast("2")
+                nx_graph.add_edge_fast("1", "2", {"weight": 3})
+                nx_graph.add_edge_fast("2", "3")
+            self.assertEqual(G.nx.nodes["1"], {"color": "red"})
+            self.assertEqual(G.nx.edges["1", "2"], {"weight": 3})
+            self.assertEqual(G.nx.number_of_edges(), 2)
+
     def test_nx_directed(self):
         G = Graph(directed=True)
         self.assertTrue(G.nx.is_directed())
@@ -1,6 +1,8 @@
 import unittest
 
 from . import Graph, DiGraph
+from .backends import DataFrameBackend, NetworkXBackend
+from .dialects import NetworkXDialect
 
 
 class TestGraph(unittest.TestCase):
@@ -14,3 +16,53 @@ class TestGraph(unittest.TestCase):
         assert Graph(directed=True).nx.is_directed() is True
         assert Graph(directed=False).nx.is_directed() is False
         assert DiGraph().nx.is_directed() is True
+
+    def test_nx_backend_exposes_networkx_graph(self):
+        G = Graph()
+        assert G.nx is G.backend._nx_graph
+        G.nx.add_edge("A", "B", weight=2)
+        assert G.backend.get_edge_by_id("A", "B") == {"weight": 2}
+
+    def test_non_nx_backend_uses_dialect(self):
+        G = Graph(backend=DataFrameBackend)
+        assert isinstance(G.nx, NetworkXDialect)
+
+    def test_nx_backend_subclass_uses_dialect(self):
+        class LoggingBackend(NetworkXBackend):
+            def add_node(self, node_name, metadata):
+                self.added = node_name
+                return super().add_node(node_name, metadata)
+
+        G = Graph(backend=LoggingBackend())
+        assert isinstance(G.nx, NetworkXDialect)
+        G.nx.add_node("A")
+        assert G.backend.added == "A"
+        D = DiGraph()
+        assert D.nx is D.backend._nx_graph
+
+    def test_indexed_nx_backend_uses_dialect(self):
+        G = Graph(backend=NetworkXBackend(indexed_attrs=["color"]))
+        assert isinstance(G.nx, NetworkXDialect)
+        G.nx.add_node("A", color="red")
+        assert G.backend.get_nodes_by_attribute("color", "red") == {"A"}
+
+    def test_dialects_are_created_lazily(self):
+        G = Graph(backend=DataFrameBackend)
+        with self.assertRaises(AttributeError):
+            Graph.igraph.__get__(G)
+        assert G.igraph is G.igraph
+        assert Graph.igraph.__get__(G) is G.igraph
+
+    def test_can_attach_dialect(self):
+        G = Graph()
+        G.attach_dialect("nx", NetworkXDialect)
+        assert isinstance(G.nx, NetworkXDialect)
+        G.attach_dialect("custom", NetworkXDialect)
+        assert isinstance(G.custom, NetworkXDialect)
+        with self.assertRaises(AttributeError):
+            G.missing
+
+    def test_graph_uses_slots(self):
+        for G in (Graph(), DiGraph()):
+            assert not hasattr(G, "__dict__")
+            assert not hasattr(G.backend, "__dict__")
@@ -1,8 +1,27 @@
+import os
+import warnings
+
 import setuptools
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
+# Set GRAND_ENABLE_SPEEDUPS=1 to compile the pure-python-mode Cython modules.
+# Without it (or without Cython, with a warning), grand installs as pure Python.
+ext_modules = []
+if os.environ.get("GRAND_ENABLE_SPEEDUPS") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        warnings.warn(
+            "GRAND_ENABLE_SPEEDUPS=1 is set, but Cython is not installed. "
+            "Installing grand as pure Python."
+        )
+    else:
+        ext_modules = cythonize(
+            ["grand/backends/_accel.py"], compiler_directives={"language_level": "3"}
+        )
+
 
 setuptools.setup(
     name="grand-graph",
@@ -14,11 +33,13 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/aplbrain/grand",
     packages=setuptools.find_packages(),
+    ext_modules=ext_modules,
     install_requires=["networkx>=2.4", "numpy", "pandas", "cachetools"],
     extras_require={
         "sql": ["SQLAlchemy>=1.3"],
         "dynamodb": ["boto3"],
         "igraph": ["igraph"],
+        "numba": ["numba"],
         "networkit": ["cmake", "cython", "networkit", "numpy<2.0.0"],
     },
     classifiers=[